@@ -0,0 +1,72 @@
+"""
+Correctness checks for behaviour the slides and benchmarks rely on.
+
+Each check_* function raises AssertionError when the behaviour is wrong. Prints one
+line per check and exits with status 1 if any of them fails.
+
+Usage:
+    python benchmarks/checks.py
+"""
+
+import os
+import sys
+import traceback
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import numpy as np  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+
+import cosmology  # noqa: E402
+import plotly_payload  # noqa: E402
+
+def check_no_big_bang_has_no_age():
+    """De Sitter and other Λ-only universes with w <= -1 never had a Big Bang."""
+    universes = [cosmology.PRESETS["dark_energy"]]
+    universes += [cosmology.Cosmology(0.0, 0.0, 1.0, w) for w in (-1.0, -1.5, -2.0)]
+    for universe in universes:
+        age = cosmology.age(cosmology.solve(universe))
+        assert np.isnan(age), f"{cosmology.describe(universe)}: age {age:.4g}, expected NaN"
+
+def check_big_bang_ages():
+    """The textbook presets have their closed-form ages, in Hubble times."""
+    expected = {"empty": 1.0, "matter": 2 / 3, "radiation": 1 / 2}
+    for name, value in expected.items():
+        age = cosmology.age(cosmology.solve(cosmology.PRESETS[name]))
+        assert abs(age - value) < 1e-3, f"{name}: age {age:.6f}, expected {value:.6f}"
+
+def check_compact_lists_become_typed_arrays():
+    """compact_figure sends numeric list data as float32 and int32 typed arrays."""
+    fig = go.Figure(go.Scatter(x=[float(i) for i in range(20)], y=list(range(20))))
+    plotly_payload.compact_figure(fig)
+    for name, dtype in (("x", np.float32), ("y", np.int32)):
+        value = getattr(fig.data[0], name)
+        assert isinstance(value, np.ndarray), f"{name} is {type(value).__name__}"
+        assert value.dtype == dtype, f"{name} is {value.dtype}, expected {dtype}"
+    assert fig.to_json().count('"bdata"') == 2, "x and y are not sent as typed arrays"
+
+def check_compact_keeps_text():
+    """Category labels are not numeric and stay as they were."""
+    fig = go.Figure(go.Bar(x=[f"bar {i}" for i in range(10)], y=list(range(10))))
+    plotly_payload.compact_figure(fig)
+    assert not isinstance(fig.data[0].x, np.ndarray), "text labels became an array"
+
+def main():
+    checks = [(name, func) for name, func in globals().items() if name.startswith("check_")]
+    failed = 0
+    for name, check in checks:
+        try:
+            check()
+        except AssertionError:
+            failed += 1
+            print(f"FAIL {name}")
+            traceback.print_exc()
+        else:
+            print(f"ok   {name}")
+    if failed:
+        print(f"\n{failed} of {len(checks)} checks failed")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Cold-start benchmark: time-to-first-paint per section.
+
+Every measurement runs app.py, with the section already selected, through AppTest
+in a fresh Python process, so module imports are paid the way a newly started server
+worker pays them, including whatever app.py itself imports. Two modes are compared:
+
+- before: the heavy modules app.py used to import at the top are loaded eagerly
+  before app.py runs
+- after: app.py as it is, which loads only the section's own modules through the
+  section registry
+
+Usage:
+    python benchmarks/cold_start.py [--repeat N] [--sections id1,id2,...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+from sections import SECTION_IDS  # noqa: E402
+
+# What app.py imported up front before sections were loaded lazily
+EAGER_IMPORTS = """
+import matplotlib.pyplot
+import numpy
+import pandas
+import plotly.graph_objects
+import plotly.express
+import physics_models
+import philosophical_arguments
+import references
+import slides
+"""
+
+# Runs inside the child process; prints one JSON line with the measurements
+CHILD_TEMPLATE = """
+import json, sys, time
+sys.path.insert(0, {assets_dir!r})
+from streamlit.testing.v1 import AppTest
+
+script = '''
+import runpy, sys
+sys.path.insert(0, {assets_dir!r})
+import streamlit as st
+st.session_state.section = {section_id!r}
+{eager}
+runpy.run_path({app_path!r})
+'''
+
+before_modules = len(sys.modules)
+at = AppTest.from_string(script, default_timeout=300)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules) - before_modules,
+    "errors": [str(e.value) for e in at.exception],
+}}))
+"""
+
+def measure(section_id, eager):
+    """Run one section in a fresh interpreter and return its measurements."""
+    code = CHILD_TEMPLATE.format(
+        assets_dir=ASSETS_DIR,
+        app_path=os.path.join(ASSETS_DIR, "app.py"),
+        eager=EAGER_IMPORTS if eager else "",
+        section_id=section_id,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, cwd=ASSETS_DIR,
+    )
+    measurement = json.loads(result.stdout.strip().splitlines()[-1])
+    if measurement["errors"]:
+        raise RuntimeError(f"{section_id}: {measurement['errors']}")
+    return measurement
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="fresh processes per section and mode (median is reported)")
+    parser.add_argument("--sections", default=",".join(SECTION_IDS),
+                        help="comma-separated section ids")
+    args = parser.parse_args()
+
+    print(f"{'section':<22}{'before (s)':>12}{'after (s)':>12}{'speedup':>10}"
+          f"{'modules before':>16}{'modules after':>15}")
+    for section_id in args.sections.split(","):
+        before = [measure(section_id, eager=True) for _ in range(args.repeat)]
+        after = [measure(section_id, eager=False) for _ in range(args.repeat)]
+        before_s = statistics.median(m["seconds"] for m in before)
+        after_s = statistics.median(m["seconds"] for m in after)
+        print(f"{section_id:<22}{before_s:>12.3f}{after_s:>12.3f}{before_s / after_s:>9.2f}x"
+              f"{before[0]['modules']:>16}{after[0]['modules']:>15}")
+
+if __name__ == "__main__":
+    main()
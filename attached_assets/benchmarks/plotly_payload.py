@@ -0,0 +1,122 @@
+"""
+Benchmark: Plotly bytes per figure, from float64 payloads to the compact ones sent now.
+
+Every cached figure builder that returns a Plotly figure is found in the slide
+modules and run at its defaults, plus the slider extremes in EXTREMES, bypassing the
+figure cache. Each figure is measured as plotly.io.to_json serializes it for
+st.plotly_chart, animation frames included, in three forms:
+
+- float64: the figure as the first builders sent it, with float64 data and surfaces
+  carrying full meshgrid x and y
+- as built: the builder's own output, before compaction
+- compact: after plotly_payload.compact_figure, as it is cached and sent
+
+"saved" compares compact against float64. Only the vacuum surface and the dark energy
+chart existed as Plotly figures when the tree started; BASELINE_BYTES holds what
+those builders sent, measured on that commit, and is printed next to them. Exits with
+status 1 if any compacted figure's data is over plotly_payload.DEFAULT_MAX_FIGURE_BYTES.
+
+Usage:
+    python benchmarks/plotly_payload.py
+"""
+
+import os
+import sys
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import numpy as np  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+import plotly.io  # noqa: E402
+
+import physics_models  # noqa: E402
+import plotly_payload  # noqa: E402
+import slides  # noqa: E402
+from plotly_payload import DATA_PROPERTIES, compact_figure  # noqa: E402
+
+# Modules whose cached figure builders are measured
+MODULES = (physics_models, slides)
+
+# Slider extremes the defaults never reach, as keyword arguments per builder
+EXTREMES = {
+    "_virtual_particle_figure": [{"resolution": 300, "n_pairs": 2000}],
+    "_random_field_figure": [{"resolution": 512}, {"resolution": 512, "copies": 3}],
+    "_spacetime_expansion_animation": [{"n_frames": 1000}],
+    "_fluctuation_ensemble_figure": [{"n_realizations": 10_000, "n_times": 10_000}],
+    "_tunneling_animation": [{"barrier_ratio": 2.0, "barrier_width": 2.0}],
+}
+
+# Bytes the builders sent at the tree's first commit, before any payload work: a
+# 100 x 100 float64 surface with meshgrid axes, and six float64 scatter traces
+BASELINE_BYTES = {
+    "_virtual_particle_figure": 354_701,
+    "_dark_energy_figure": 21_623,
+}
+
+def plotly_builders():
+    """(name, builder) for every cached figure builder that returns a Plotly figure."""
+    found = []
+    for module in MODULES:
+        for name, func in sorted(vars(module).items()):
+            builder = getattr(func, "__wrapped__", None)
+            if name.startswith("_") and builder is not None and callable(func):
+                try:
+                    figure = builder()
+                except TypeError:
+                    continue  # Not a figure builder: it needs arguments
+                if isinstance(figure, go.Figure):
+                    found.append((name, builder))
+    return found
+
+def as_float64(fig):
+    """fig with float64 data and meshgrid x and y on surfaces, as the first builders sent it."""
+    for trace in plotly_payload._traces(fig):
+        if (trace.type == "surface" and isinstance(trace.z, np.ndarray) and trace.z.ndim == 2
+                and isinstance(trace.x, np.ndarray) and trace.x.ndim == 1):
+            x, y = np.meshgrid(trace.x, trace.y)
+            plotly_payload._replace(trace, "x", x)
+            plotly_payload._replace(trace, "y", y)
+        for name in DATA_PROPERTIES:
+            value = getattr(trace, name, None)
+            if isinstance(value, np.ndarray) and value.dtype.kind == "f" and value.dtype != np.float64:
+                plotly_payload._replace(trace, name, value.astype(np.float64))
+    return fig
+
+def nbytes(fig):
+    """Bytes st.plotly_chart sends for fig."""
+    return len(plotly.io.to_json(fig, validate=False))
+
+def main():
+    print(f"{'figure':<56}{'frames':>7}{'float64':>11}{'as built':>11}{'compact':>11}"
+          f"{'saved':>7}{'baseline':>11}")
+    over_budget = []
+    total_float64 = total_compact = 0
+    for name, builder in plotly_builders():
+        for kwargs in [{}] + EXTREMES.get(name, []):
+            label = name + "(" + ", ".join(f"{key}={value}" for key, value in kwargs.items()) + ")"
+            float64 = nbytes(as_float64(builder(**kwargs)))
+            built = builder(**kwargs)
+            frames = len(built.frames or ())
+            as_built = nbytes(built)
+            compact = compact_figure(builder(**kwargs))
+            compact_bytes = nbytes(compact)
+            data_bytes = plotly_payload.data_nbytes(compact)
+            if data_bytes > plotly_payload.DEFAULT_MAX_FIGURE_BYTES:
+                over_budget.append(f"{label}: {data_bytes} data bytes")
+            total_float64 += float64
+            total_compact += compact_bytes
+            baseline = BASELINE_BYTES.get(name, "") if not kwargs else ""
+            print(f"{label:<56}{frames:>7}{float64:>11}{as_built:>11}{compact_bytes:>11}"
+                  f"{1 - compact_bytes / float64:>7.0%}{baseline:>11}")
+    print(f"{'total':<56}{'':>7}{total_float64:>11}{'':>11}{total_compact:>11}"
+          f"{1 - total_compact / total_float64:>7.0%}")
+
+    if over_budget:
+        print(f"\nOver the {plotly_payload.DEFAULT_MAX_FIGURE_BYTES}-byte budget:")
+        for line in over_budget:
+            print(f"  {line}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: matplotlib rasterization under concurrent sessions, in-process vs render_pool.
+
+Captures the figures of the matplotlib-heavy slides once, then has 1, 8 and 32
+simulated sessions render all of them at the same time, each on its own thread the
+way Streamlit runs scripts. Every render rebuilds its figure from a pickle (standing
+in for the slide code building it) and calls figure_png. Reports per-render latency
+percentiles, throughput, and how late a 5 ms heartbeat thread wakes up: the delay
+any other session's script would see while the renders hold the GIL.
+
+Usage:
+    python benchmarks/render_concurrency.py [--sessions 1,8,32] [--processes N]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import threading
+import time
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+import headless  # noqa: E402
+import render_pool  # noqa: E402
+from figure_cache import figure_cache, figure_png, png_observers  # noqa: E402
+from sections import load_section  # noqa: E402
+
+SLIDES = ("definitions", "quantum_mechanics", "philosophical", "logical_fallacies", "metaphysical")
+
+HEARTBEAT_SECONDS = 0.005
+
+def capture_specs():
+    """Pickled figures of every matplotlib chart the slides draw."""
+    specs = []
+
+    def capture(fig, png, seconds):
+        specs.append(pickle.dumps(fig))
+
+    png_observers.append(capture)
+    try:
+        for section_id in SLIDES:
+            figure_cache.clear()
+            headless.run(load_section(section_id))
+    finally:
+        png_observers.remove(capture)
+    return specs
+
+def heartbeat(stop, lateness):
+    """Sleep HEARTBEAT_SECONDS at a time and record how late each wake-up is."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        time.sleep(HEARTBEAT_SECONDS)
+        lateness.append(time.perf_counter() - start - HEARTBEAT_SECONDS)
+
+def run_sessions(specs, n_sessions):
+    """Render every spec from n_sessions threads at once; return latencies, wall time, lateness."""
+    latencies, lateness = [], []
+    barrier = threading.Barrier(n_sessions + 1)
+    stop = threading.Event()
+
+    def session():
+        barrier.wait()
+        for spec in specs:
+            start = time.perf_counter()
+            figure_png(pickle.loads(spec))
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=session) for _ in range(n_sessions)]
+    for thread in threads:
+        thread.start()
+    monitor = threading.Thread(target=heartbeat, args=(stop, lateness))
+    monitor.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    stop.set()
+    monitor.join()
+    return np.array(latencies), wall, np.array(lateness)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", default="1,8,32", help="comma-separated session counts")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="render_pool workers (default: one per CPU)")
+    args = parser.parse_args()
+
+    specs = capture_specs()
+    print(f"{len(specs)} figures per session, {os.cpu_count()} CPUs, {args.processes} render processes\n")
+    print(f"{'backend':<14}{'sessions':>9}{'p50 ms':>10}{'p99 ms':>10}{'renders/s':>11}"
+          f"{'heartbeat p99 ms':>18}")
+    for backend in ("in-process", "process pool"):
+        if backend == "process pool":
+            render_pool.start(args.processes)
+        for n_sessions in (int(value) for value in args.sessions.split(",")):
+            latencies, wall, lateness = run_sessions(specs, n_sessions)
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+            print(f"{backend:<14}{n_sessions:>9}{p50:>10.0f}{p99:>10.0f}{len(latencies) / wall:>11.1f}"
+                  f"{np.percentile(lateness, 99) * 1000:>18.1f}")
+    render_pool.shutdown()
+
+if __name__ == "__main__":
+    main()
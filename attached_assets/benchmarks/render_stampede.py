@@ -0,0 +1,91 @@
+"""
+Benchmark: many sessions opening the Cosmological slide at the same instant.
+
+Every session thread asks for the figures of dark_energy_visualization and
+spacetime_expansion_visualization at once, with all caches cold. "independent"
+calls the builders directly, the way each session computed them before the
+scheduler; "single-flight" goes through the shared figure cache, where concurrent
+misses for one figure wait on a single build. Reports wall time until the last
+session has its figures, how many builds ran, and how many raised: matplotlib's
+mathtext parser is not thread-safe, so concurrent builds of figures with LaTeX
+labels can fail.
+
+Usage:
+    python benchmarks/render_stampede.py [--sessions 1,10,50]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+import cosmology  # noqa: E402
+import physics_models  # noqa: E402
+from figure_cache import figure_cache  # noqa: E402
+from render_scheduler import scheduler  # noqa: E402
+
+BUILDERS = (
+    physics_models._dark_energy_figure,
+    physics_models._expansion_history_figure,
+    physics_models._age_map_figure,
+    physics_models._spacetime_expansion_panels_figure,
+    physics_models._spacetime_expansion_energy_figure,
+)
+
+def cold_caches():
+    figure_cache.clear()
+    cosmology.solve.cache_clear()
+    cosmology.age_grid.cache_clear()
+
+def stampede(n_sessions, independent):
+    """Wall time for n_sessions threads to each get every figure, builds run and failures."""
+    cold_caches()
+    builds = scheduler.stats()["builds"]
+    calls = [builder.__wrapped__ if independent else builder for builder in BUILDERS]
+    barrier = threading.Barrier(n_sessions + 1)
+    failures = []
+
+    def session():
+        barrier.wait()
+        for call in calls:
+            try:
+                call()
+            except Exception as error:
+                failures.append(error)
+
+    threads = [threading.Thread(target=session) for _ in range(n_sessions)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    built = n_sessions * len(calls) if independent else scheduler.stats()["builds"] - builds
+    return wall, built, len(failures)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", default="1,10,50", help="comma-separated session counts")
+    args = parser.parse_args()
+
+    # Imports and fonts paid outside the measurements
+    stampede(1, independent=True)
+    print(f"{'sessions':>9}{'independent s':>15}{'builds':>8}{'failed':>8}"
+          f"{'single-flight s':>17}{'builds':>8}{'failed':>8}")
+    for n_sessions in (int(value) for value in args.sessions.split(",")):
+        independent = stampede(n_sessions, independent=True)
+        shared = stampede(n_sessions, independent=False)
+        print(f"{n_sessions:>9}{independent[0]:>15.2f}{independent[1]:>8}{independent[2]:>8}"
+              f"{shared[0]:>17.2f}{shared[1]:>8}{shared[2]:>8}")
+
+if __name__ == "__main__":
+    main()
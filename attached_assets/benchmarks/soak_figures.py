@@ -0,0 +1,121 @@
+"""
+Soak test for the matplotlib figure lifecycle.
+
+Renders slide figures over and over, the way a long-running server renders them
+on every rerun, and checks that resident memory and the number of live figures
+stay flat. Exits with status 1 if they grow.
+
+Usage:
+    python benchmarks/soak_figures.py [--reruns 10000] [--mode builders|figures|pyplot]
+
+--mode builders (the default) cycles through the real slide builders: each rerun
+clears the figure cache, builds one through cached_figure and figure_png, and
+shows it with show_figure under the headless recorder. --mode figures draws a
+synthetic chart with figures.subplots() alone; --mode pyplot reproduces the old
+plt.subplots()-without-close behaviour for comparison; expect it to fail.
+"""
+
+import argparse
+import gc
+import os
+import resource
+import sys
+import time
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+import figures  # noqa: E402
+import headless  # noqa: E402
+import philosophical_arguments  # noqa: E402
+import slides  # noqa: E402
+import utils  # noqa: E402
+from figure_cache import figure_cache, show_figure  # noqa: E402
+
+# Real matplotlib builders, taken in turn by --mode builders
+BUILDERS = (
+    slides._energy_transformations_figure,
+    slides._physics_domains_figure,
+    philosophical_arguments._bayesian_update_figure,
+    philosophical_arguments._conservation_scales_figure,
+    lambda: utils.create_timeline({"1842": "Mayer", "1847": "Helmholtz", "1915": "Noether"}),
+)
+
+def rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def draw_slide_chart(fig, ax, i):
+    """Draw a chart with the artists slides typically use: lines, bars, fills and text."""
+    x = np.linspace(0, 10, 200)
+    ax.plot(x, np.sin(x + i), 'b-', linewidth=2, label='Signal')
+    ax.fill_between(x, -1, 1, color='blue', alpha=0.2)
+    ax.bar(np.arange(5), np.linspace(0.2, 1.0, 5), width=0.35, label='Bars')
+    for j in range(5):
+        ax.text(j, 0.05, f'label {j}', ha='center')
+    ax.annotate('annotation', xy=(5, 0.5), xytext=(3, 0.8),
+                arrowprops=dict(facecolor='black', shrink=0.05))
+    ax.set_title(f'Rerun {i}')
+    ax.legend(loc='upper right')
+    fig.canvas.draw()
+
+def rerun(i, mode):
+    """Render one figure the way a slide does on a rerun."""
+    if mode == "builders":
+        figure_cache.clear()
+        with headless.recording():
+            show_figure(BUILDERS[i % len(BUILDERS)]())
+    elif mode == "pyplot":
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=(10, 6))
+        draw_slide_chart(fig, ax, i)
+    else:
+        with figures.subplots(figsize=(10, 6)) as (fig, ax):
+            draw_slide_chart(fig, ax, i)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reruns", type=int, default=10000)
+    parser.add_argument("--mode", choices=["builders", "figures", "pyplot"], default="builders")
+    parser.add_argument("--tolerance-mb", type=float, default=25.0,
+                        help="allowed RSS growth after warm-up")
+    args = parser.parse_args()
+
+    checkpoint_every = max(args.reruns // 10, 1)
+    start = time.perf_counter()
+    baseline = None
+    print(f"{'rerun':>8}{'rss (MB)':>12}{'live figs':>11}{'pooled':>8}{'pyplot':>8}{'agg bytes':>12}")
+    for i in range(1, args.reruns + 1):
+        rerun(i, args.mode)
+        if i % checkpoint_every == 0:
+            gc.collect()
+            rss = rss_mb()
+            stats = figures.stats()
+            # The first checkpoint is the warm-up: pools, font caches and renderers are populated
+            if baseline is None:
+                baseline = (rss, stats["pyplot_open"])
+            print(f"{i:>8}{rss:>12.1f}{stats['live']:>11}{stats['pooled']:>8}"
+                  f"{stats['pyplot_open']:>8}{stats['bytes']:>12}")
+
+    elapsed = time.perf_counter() - start
+    growth = rss - baseline[0]
+    print(f"\n{args.reruns} reruns in {elapsed:.1f}s; RSS growth after warm-up: {growth:.1f} MB")
+    leaked = stats["pyplot_open"] > baseline[1] or stats["live"] > stats["pooled"]
+    if growth > args.tolerance_mb or leaked:
+        print("FAIL: memory or live figures grew during the soak")
+        sys.exit(1)
+    print("OK: memory is flat")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Per-slide benchmark suite with a stored baseline.
+
+Covers every public visualization in physics_models.py, every display_*_slide in
+philosophical_arguments.py, utils.create_comparison_table, utils.create_timeline,
+translations.get_translation, a 100 x 100 cosmology.solve_grid sweep and a 10,000 x
+1,000 ensemble.run. Each case is run headlessly with the figure cache and the
+solvers' lru caches cleared, so figures and the data behind them are computed
+from scratch every time, and records:
+
+- seconds: fastest wall time over --repeat runs (the least noisy estimate on a
+  shared machine)
+- peak_mb: peak memory traced by tracemalloc during one extra run
+- bytes: serialized payload the case sends to the browser (figures, tables, text)
+- artists: artists in the matplotlib figures the case draws
+- draw_seconds: time spent rasterizing those figures (fastest run)
+
+--save writes the results to the baseline file. --compare fails (exit status 1)
+when any case is more than --threshold percent slower or heavier than its baseline.
+The baseline is the reference later changes are judged against: re-save it only
+in a commit that says why the stored numbers no longer apply. Timings only compare
+on the machine the baseline was recorded on: on any other, --compare warns and
+checks peak memory, bytes and artists only.
+
+Usage:
+    python benchmarks/suite.py --save
+    python benchmarks/suite.py --compare [--threshold 20] [--cases name1,name2]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+import cosmology  # noqa: E402
+import ensemble  # noqa: E402
+import hawking  # noqa: E402
+import headless  # noqa: E402
+import philosophical_arguments  # noqa: E402
+import physics_models  # noqa: E402
+import tunneling  # noqa: E402
+import utils  # noqa: E402
+from figure_cache import figure_cache, show_figure  # noqa: E402
+from translations import get_translation, translations  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+METRICS = ("seconds", "draw_seconds", "peak_mb", "bytes", "artists")
+TIME_METRICS = ("seconds", "draw_seconds")
+
+# Time differences below this are timer noise, not regressions
+MIN_SECONDS_DELTA = 0.005
+
+COMPARISON_DATA = {
+    "Classical Physics": ["Energy is conserved", "Time-translation symmetry", "Closed systems"] * 4,
+    "Quantum Field Theory": ["Virtual particles", "Vacuum fluctuations"] * 5,
+    "General Relativity": ["No global energy", "Expanding spacetime", "Pseudo-tensors"] * 3,
+}
+
+TIMELINE_EVENTS = {
+    "1687": "Newton's Principia",
+    "1847": "Helmholtz: conservation of force",
+    "1905": "Special relativity",
+    "1915": "Noether's theorem",
+    "1916": "General relativity",
+    "1929": "Hubble expansion",
+    "1974": "Hawking radiation",
+    "1998": "Accelerating expansion",
+}
+
+# Memoized solvers behind the figures; cleared with the figure cache before every run
+SOLVER_CACHES = (
+    cosmology.solve,
+    cosmology.age_grid,
+    hawking.curve_table,
+    tunneling.evolve,
+    physics_models._vacuum_modes,
+)
+
+# Every case returns the headless.RenderReport of its run
+
+def _slide_case(func):
+    def case():
+        return headless.run(func)
+    return case
+
+def _comparison_table():
+    # create_comparison_table pads its argument in place, so pass a fresh copy
+    data = {header: list(items) for header, items in COMPARISON_DATA.items()}
+    return headless.run(utils.create_comparison_table, data)
+
+def _show_timeline():
+    show_figure(utils.create_timeline(TIMELINE_EVENTS))
+
+def _timeline():
+    return headless.run(_show_timeline)
+
+def _lookup_translations():
+    keys = [(key, language) for language in translations for key in translations[language]]
+    for _ in range(100):
+        for key, language in keys:
+            get_translation(key, language)
+
+def _translations():
+    return headless.run(_lookup_translations)
+
+def _friedmann_sweep():
+    # solve_grid itself, not the lru-cached age_grid, so every run integrates
+    omega = np.linspace(0, 2, 100)
+    return headless.run(cosmology.solve_grid, omega[None, :], 9e-5, omega[:, None], -1.0)
+
+def _fluctuation_ensemble():
+    times = np.linspace(0, 10, 1_000)
+    return headless.run(ensemble.run, 10_000, physics_models.CLASSICAL_ENERGY,
+                        physics_models.fluctuation_scale(times))
+
+def cases():
+    """Benchmark cases by name, discovered from the modules they cover."""
+    found = {}
+    for name in sorted(dir(physics_models)):
+        if name.endswith("_visualization"):
+            found[f"physics_models.{name}"] = _slide_case(getattr(physics_models, name))
+    for name in sorted(dir(philosophical_arguments)):
+        if name.startswith("display_") and name.endswith("_slide"):
+            found[f"philosophical_arguments.{name}"] = _slide_case(getattr(philosophical_arguments, name))
+    found["utils.create_comparison_table"] = _comparison_table
+    found["utils.create_timeline"] = _timeline
+    found["translations.get_translation"] = _translations
+    found["cosmology.solve_grid"] = _friedmann_sweep
+    found["ensemble.run"] = _fluctuation_ensemble
+    return found
+
+def cold_caches():
+    """Forget every cached figure and solver result."""
+    figure_cache.clear()
+    for cached in SOLVER_CACHES:
+        cached.cache_clear()
+
+def measure(case, repeat):
+    """Run a case cold repeat times plus once under tracemalloc."""
+    # Warm-up pays one-off imports and font loading outside the measurements
+    cold_caches()
+    case()
+
+    times, draw_times = [], []
+    for _ in range(repeat):
+        cold_caches()
+        start = time.perf_counter()
+        report = case()
+        times.append(time.perf_counter() - start)
+        draw_times.append(report.draw_seconds)
+
+    cold_caches()
+    tracemalloc.start()
+    try:
+        case()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "draw_seconds": min(draw_times), "peak_mb": peak / 1e6,
+            "bytes": report.total_bytes, "artists": report.artists}
+
+def machine():
+    """The Python, platform and CPU count results are recorded on."""
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "cpus": os.cpu_count()}
+
+def regressions(name, result, baseline, threshold, timings=True):
+    """Metrics of result that exceed baseline by more than threshold percent."""
+    found = []
+    for metric in METRICS:
+        if metric not in baseline:
+            continue  # Recorded by a newer suite than the baseline
+        if metric in TIME_METRICS and not timings:
+            continue
+        before, after = baseline[metric], result[metric]
+        if metric in TIME_METRICS and after - before < MIN_SECONDS_DELTA:
+            continue
+        if after > before * (1 + threshold / 100):
+            change = f"{(after / before - 1) * 100:+.0f}%" if before else "new"
+            found.append(f"{name}: {metric} {before:.4g} -> {after:.4g} ({change})")
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    mode.add_argument("--compare", action="store_true", help="fail on regressions against the baseline")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="allowed slowdown or growth, in percent (default 20)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (the fastest is kept)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--cases", default=None, help="comma-separated case names (default: all)")
+    args = parser.parse_args()
+
+    selected = cases()
+    if args.cases:
+        selected = {name: selected[name] for name in args.cases.split(",")}
+
+    baseline, timings = {}, True
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as source:
+            stored = json.load(source)
+        baseline = stored["cases"]
+        if stored.get("machine") != machine():
+            timings = False
+            recorded = stored.get("machine") or {}
+            print("Warning: the baseline was recorded on another machine; timings are shown "
+                  "but not checked")
+            for key, value in sorted(machine().items()):
+                print(f"  {key}: {recorded.get(key)} in the baseline, {value} here")
+            print()
+
+    results, failures = {}, []
+    print(f"{'case':<58}{'ms':>10}{'draw ms':>10}{'peak MB':>10}{'bytes':>10}{'artists':>9}"
+          f"{'vs baseline':>14}")
+    for name, case in selected.items():
+        result = results[name] = measure(case, args.repeat)
+        change = ""
+        if name in baseline:
+            before = baseline[name]["seconds"]
+            change = f"{(result['seconds'] / before - 1) * 100:+.0f}%" if before else ""
+            failures += regressions(name, result, baseline[name], args.threshold, timings)
+        elif args.compare:
+            change = "new"
+        print(f"{name:<58}{result['seconds'] * 1000:>10.1f}{result['draw_seconds'] * 1000:>10.1f}"
+              f"{result['peak_mb']:>10.1f}{result['bytes']:>10}{result['artists']:>9}{change:>14}")
+
+    if args.save:
+        # Saving a subset of cases keeps the stored numbers for the others
+        saved = {}
+        if args.cases and os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as source:
+                saved = json.load(source)["cases"]
+        saved.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as output:
+            json.dump({
+                "machine": machine(),
+                "cases": saved,
+            }, output, indent=2, sort_keys=True)
+            output.write("\n")
+        print(f"Baseline saved to {args.baseline}")
+
+    if failures:
+        print(f"\n{len(failures)} regression(s) above {args.threshold:g}%:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: batched Gaussian vacuum field vs the original per-bump Python loop.
+
+Reports wall time and peak traced memory for both implementations across grid
+sizes and pair counts, plus the maximum difference between their results. The
+last column is the FFT random field (fields.gaussian_random_field) on the same
+grid in float32, whose cost does not depend on the number of pairs.
+
+Usage:
+    python benchmarks/vacuum_field.py [--skip-loop-above N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ASSETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ASSETS_DIR)
+
+import numpy as np  # noqa: E402
+
+from fields import gaussian_bumps, gaussian_random_field  # noqa: E402
+
+CASES = [
+    # (grid resolution, number of pairs)
+    (100, 15),
+    (500, 100),
+    (1000, 1000),
+    (2000, 1000),
+    (2000, 5000),
+]
+
+def loop_field(x, y, centers, sigmas, amplitudes):
+    """The original implementation: one full-grid temporary per bump."""
+    X, Y = np.meshgrid(x, y)
+    Z = np.zeros_like(X)
+    for (x0, y0), sigma, amplitude in zip(centers, sigmas, amplitudes):
+        Z += amplitude * np.exp(-((X - x0)**2 + (Y - y0)**2) / (2 * sigma**2))
+    return Z
+
+def measure(func, *args, **kwargs):
+    """Return (result, seconds, peak MB) for one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--skip-loop-above", type=int, default=1_000_000_000,
+                        help="skip the loop when resolution**2 * pairs exceeds this")
+    args = parser.parse_args()
+
+    print(f"{'grid':>11}{'pairs':>7}{'loop (s)':>10}{'loop MB':>9}"
+          f"{'f64 (s)':>9}{'f64 MB':>8}{'f32 (s)':>9}{'f32 MB':>8}{'speedup':>9}{'max diff':>10}"
+          f"{'fft (s)':>9}")
+    rng = np.random.default_rng(0)
+    for resolution, n_pairs in CASES:
+        x = np.linspace(0, 10, resolution)
+        y = np.linspace(0, 10, resolution)
+        centers = rng.uniform(0, 10, size=(n_pairs, 2))
+        sigmas = rng.uniform(0.2, 0.4, size=n_pairs)
+        amplitudes = rng.uniform(0.5, 1.0, size=n_pairs)
+        params = (x, y, centers, sigmas, amplitudes)
+
+        fast, fast_s, fast_mb = measure(gaussian_bumps, *params)
+        _, f32_s, f32_mb = measure(gaussian_bumps, *params, dtype=np.float32)
+        _, fft_s, _ = measure(gaussian_random_field, rng, (resolution, resolution))
+        if resolution**2 * n_pairs <= args.skip_loop_above:
+            slow, loop_s, loop_mb = measure(loop_field, *params)
+            diff = f"{np.max(np.abs(slow - fast)):.1e}"
+            loop_cols = f"{loop_s:>10.3f}{loop_mb:>9.1f}"
+            speedup = f"{loop_s / fast_s:>8.1f}x"
+        else:
+            loop_cols, speedup, diff = f"{'-':>10}{'-':>9}", f"{'-':>9}", "-"
+        print(f"{resolution:>5}x{resolution:<5}{n_pairs:>7}{loop_cols}"
+              f"{fast_s:>9.3f}{fast_mb:>8.1f}{f32_s:>9.3f}{f32_mb:>8.1f}{speedup}{diff:>10}{fft_s:>9.3f}")
+
+if __name__ == "__main__":
+    main()
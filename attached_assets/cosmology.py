@@ -0,0 +1,167 @@
+"""
+Friedmann-equation solver for the cosmology slides.
+
+For density parameters Ω_m (matter), Ω_r (radiation), Ω_Λ (dark energy with equation
+of state w) and the curvature Ω_k = 1 - Ω_m - Ω_r - Ω_Λ, the expansion rate is
+
+    H(a)² / H0² = Ω_r a⁻⁴ + Ω_m a⁻³ + Ω_k a⁻² + Ω_Λ a^(-3(1 + w))
+
+and cosmic time follows from dt = d(ln a) / H. The integral is evaluated on one
+shared grid of scale factors for any number of parameter sets at once, so a whole
+grid of cosmologies costs a few array operations. Times are in units of the Hubble
+time 1/H0 (HUBBLE_TIME_GYR converts them to billions of years).
+
+Only the expanding branch is followed: once H² reaches zero (a closed universe
+turning around, or no Big Bang at all) the remaining times are NaN.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+Cosmology = namedtuple("Cosmology", ["omega_m", "omega_r", "omega_lambda", "w"])
+
+# Planck 2018 best fit, and the textbook universes the slides compare it to
+PRESETS = {
+    "lcdm": Cosmology(0.315, 9.0e-5, 0.685, -1.0),
+    "empty": Cosmology(0.0, 0.0, 0.0, -1.0),
+    "matter": Cosmology(1.0, 0.0, 0.0, -1.0),
+    "radiation": Cosmology(0.0, 1.0, 0.0, -1.0),
+    "dark_energy": Cosmology(0.0, 0.0, 1.0, -1.0),
+}
+PRESET_LABELS = {
+    "lcdm": "ΛCDM (Planck 2018)",
+    "empty": "Empty (Milne): a ∝ t",
+    "matter": "Matter only (Einstein-de Sitter): a ∝ t^(2/3)",
+    "radiation": "Radiation only: a ∝ t^(1/2)",
+    "dark_energy": "Dark energy only (de Sitter): a ∝ exp(Ht)",
+}
+
+# Hubble time for H0 = 67.4 km/s/Mpc, in Gyr
+HUBBLE_TIME_GYR = 977.79 / 67.4
+
+# Scale-factor grid: from deep in the radiation era to ten times today's size, with
+# a = 1 (today) included exactly
+A_MIN = 1e-6
+A_MAX = 10.0
+DEFAULT_POINTS = 1000
+
+# The age map needs one number per cosmology; a coarser grid keeps the sweep's
+# temporaries small and is accurate to ~1e-4 except next to the no-Big-Bang boundary
+AGE_GRID_POINTS = 400
+
+Solution = namedtuple("Solution", ["a", "t", "hubble"])
+
+def scale_factor_grid(n_points=DEFAULT_POINTS):
+    """Log-spaced scale factors from A_MIN to A_MAX; today (a = 1) is at index today_index()."""
+    n_past = today_index(n_points) + 1
+    return np.concatenate([np.geomspace(A_MIN, 1.0, n_past),
+                           np.geomspace(1.0, A_MAX, n_points - n_past + 1)[1:]])
+
+def today_index(n_points=DEFAULT_POINTS):
+    """Index of a = 1 in scale_factor_grid(n_points)."""
+    # Same log spacing on both sides of a = 1
+    past_decades = np.log10(1.0 / A_MIN)
+    return int(round((n_points - 1) * past_decades / np.log10(A_MAX / A_MIN)))
+
+def hubble_squared(a, omega_m, omega_r, omega_lambda, w):
+    """H(a)² / H0² for the given parameters; arguments broadcast against each other."""
+    omega_k = 1.0 - omega_m - omega_r - omega_lambda
+    return (omega_r * a**-4 + omega_m * a**-3 + omega_k * a**-2
+            + omega_lambda * a**(-3.0 * (1.0 + w)))
+
+def solve_grid(omega_m, omega_r=0.0, omega_lambda=0.0, w=-1.0, n_points=DEFAULT_POINTS):
+    """Integrate the Friedmann equation for every parameter set at once.
+
+    Parameters are scalars or arrays that broadcast to a common shape S. Returns a
+    Solution with a of shape (n_points,) and t, hubble (H / H0) of shape S + (n_points,).
+    """
+    a = scale_factor_grid(n_points)
+    omega_m, omega_r, omega_lambda, w = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (omega_m, omega_r, omega_lambda, w)))
+    if w.size and np.all(w == w.flat[0]):
+        # One equation of state for the whole grid: H² is a linear combination of
+        # four fixed functions of a, i.e. a single matrix product
+        omega_k = 1.0 - omega_m - omega_r - omega_lambda
+        weights = np.stack([omega_r, omega_m, omega_k, omega_lambda], axis=-1)
+        basis = np.stack([a**-4, a**-3, a**-2, a**(-3.0 * (1.0 + w.flat[0]))])
+        h2 = weights @ basis
+    else:
+        h2 = hubble_squared(a, omega_m[..., None], omega_r[..., None],
+                            omega_lambda[..., None], w[..., None])
+
+    # Everything from the first a with H² <= 0 on is off the expanding branch
+    h2[np.logical_or.accumulate(h2 <= 0, axis=-1)] = np.nan
+    hubble = np.sqrt(h2, out=h2)
+
+    # Trapezoidal rule in ln a: dt = d(ln a) / H
+    dlna = np.diff(np.log(a))
+    inverse = 1.0 / hubble
+    t = np.empty_like(hubble)
+    np.add(inverse[..., 1:], inverse[..., :-1], out=t[..., 1:])
+    t[..., 1:] *= 0.5 * dlna
+    np.cumsum(t[..., 1:], axis=-1, out=t[..., 1:])
+
+    # Time already elapsed at A_MIN, from the local power law a ∝ t^p: there
+    # H = p / t and H ∝ a^(-1/p), so t = 1 / (q H) with q = -d(ln H)/d(ln a).
+    # With q <= 0 (e.g. de Sitter, where H is constant) there is no power-law Big
+    # Bang behind the grid, so no time since it either
+    q = np.log(hubble[..., 0] / hubble[..., 1]) / dlna[0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t[..., 0] = np.where(q > 0, 1.0 / (q * hubble[..., 0]), np.nan)
+    t[..., 1:] += t[..., :1]
+    return Solution(a, t, hubble)
+
+@lru_cache(maxsize=128)
+def solve(cosmology, n_points=DEFAULT_POINTS):
+    """Solution for one Cosmology, cached by its parameters. The arrays are read-only."""
+    solution = solve_grid(*cosmology, n_points=n_points)
+    for array in solution:
+        array.flags.writeable = False
+    return solution
+
+def age(solution):
+    """Time at a = 1 (the age of the universe), in Hubble times; works on grid solutions."""
+    return solution.t[..., today_index(len(solution.a))]
+
+@lru_cache(maxsize=16)
+def age_grid(omega_r, w, n=100, max_omega=2.0):
+    """Ages over an n x n grid of Ω_m and Ω_Λ in [0, max_omega], in Gyr.
+
+    Rows run over Ω_Λ, columns over Ω_m; NaN marks universes without a Big Bang or
+    that recollapse before reaching today's size.
+    """
+    omega_m = np.linspace(0, max_omega, n)
+    omega_lambda = np.linspace(0, max_omega, n)
+    solution = solve_grid(omega_m[None, :], omega_r, omega_lambda[:, None], w, n_points=AGE_GRID_POINTS)
+    ages = age(solution) * HUBBLE_TIME_GYR
+    ages.flags.writeable = False
+    return omega_m, omega_lambda, ages
+
+def expanding_part(solution):
+    """Scale factors, times and H of a single solution, restricted to the expanding branch."""
+    valid = np.isfinite(solution.t)
+    return solution.a[valid], solution.t[valid], solution.hubble[valid]
+
+def comoving_energies(a, cosmology):
+    """Energy of each component in a fixed comoving volume, relative to today's critical density.
+
+    Matter stays constant, radiation falls as 1/a and dark energy grows as a^(-3w).
+    """
+    a = np.asarray(a, dtype=float)
+    return {
+        "matter": np.full_like(a, cosmology.omega_m),
+        "radiation": cosmology.omega_r / a,
+        "dark_energy": cosmology.omega_lambda * a**(-3.0 * cosmology.w),
+    }
+
+def densities(a, cosmology):
+    """Density of each component relative to today's critical density."""
+    return {name: energy / np.asarray(a, dtype=float)**3
+            for name, energy in comoving_energies(a, cosmology).items()}
+
+def describe(cosmology):
+    """Short parameter summary for figure titles."""
+    return (f"Ω_m = {cosmology.omega_m:g}, Ω_r = {cosmology.omega_r:g}, "
+            f"Ω_Λ = {cosmology.omega_lambda:g}, w = {cosmology.w:g}")
@@ -0,0 +1,134 @@
+"""
+Downsampling of large series before they reach matplotlib or Plotly.
+
+A chart can only show about one point per pixel column, so sending more just costs
+rendering time and payload. Two reducers pick the points to keep:
+
+- minmax_indices: the lowest and highest sample of every pixel-wide bucket. Keeps
+  every visual peak exactly; the right choice for noise (minmax_envelope gives the
+  same extremes as a band to fill).
+- lttb_indices: Largest-Triangle-Three-Buckets, one sample per bucket chosen to
+  preserve the shape of the line; the right choice for smooth curves.
+
+Both return indices into the original arrays, so several series sampled on the
+same x can share one selection. bucket_means averages each bucket instead, for
+densities whose area matters.
+"""
+
+import numpy as np
+
+# Points kept per horizontal pixel: a min and a max for noise, one for smooth curves
+POINTS_PER_PIXEL = {"minmax": 2, "lttb": 1}
+
+# Width assumed for Plotly charts, which size themselves in the browser
+DEFAULT_PLOTLY_WIDTH_PX = 800
+
+# Trace data budget for one Plotly figure, in serialized bytes
+DEFAULT_MAX_PAYLOAD_BYTES = 100_000
+
+# Serialized size of one (x, y) point: two float32 values, base64 encoded
+BYTES_PER_POINT = 2 * 4 * 4 / 3
+
+def minmax_indices(y, n_out):
+    """Indices of the minimum and maximum of y in each of n_out // 2 equal buckets."""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    n_buckets = max(1, n_out // 2)
+    size = n // n_buckets
+    blocks = np.asarray(y)[:size * n_buckets].reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    indices = [[0], offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), [n - 1]]
+    if size * n_buckets < n:
+        # Leftover samples at the end form one more bucket
+        tail = np.asarray(y)[size * n_buckets:]
+        indices.append([size * n_buckets + tail.argmin(), size * n_buckets + tail.argmax()])
+    return np.unique(np.concatenate(indices))
+
+def minmax_envelope(x, y, n_buckets):
+    """Bucket centres with the lowest and highest y of each of n_buckets equal buckets.
+
+    For series so dense that the min/max line would fill its own envelope anyway:
+    draw it as ax.fill_between(centres, lows, highs).
+    """
+    n = len(y)
+    n_buckets = min(n, n_buckets)
+    size = n // n_buckets
+    blocks = np.asarray(y)[:size * n_buckets].reshape(n_buckets, size)
+    centres = np.asarray(x)[:size * n_buckets].reshape(n_buckets, size).mean(axis=1)
+    return centres, blocks.min(axis=1), blocks.max(axis=1)
+
+def bucket_means(x, y, n_buckets):
+    """Bucket centres and the mean of y over each of n_buckets equal buckets.
+
+    Averaging keeps the area under the curve, which suits densities; y may carry
+    leading axes (several frames over the same x).
+    """
+    n = len(x)
+    edges = np.linspace(0, n, min(n, n_buckets) + 1).astype(np.intp)[:-1]
+    counts = np.diff(np.append(edges, n))
+    centres = np.add.reduceat(np.asarray(x, dtype=float), edges) / counts
+    return centres, np.add.reduceat(np.asarray(y, dtype=float), edges, axis=-1) / counts
+
+def lttb_indices(x, y, n_out):
+    """Indices of the n_out points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept. Each bucket in between keeps the
+    point forming the largest triangle with the point kept in the previous bucket
+    and the mean of the next bucket.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Buckets over the interior points 1 .. n - 2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    sums_x = np.concatenate([[0.0], np.cumsum(x)])
+    sums_y = np.concatenate([[0.0], np.cumsum(y)])
+    counts = edges[1:] - edges[:-1]
+    mean_x = (sums_x[edges[1:]] - sums_x[edges[:-1]]) / counts
+    mean_y = (sums_y[edges[1:]] - sums_y[edges[:-1]]) / counts
+    # The next bucket after the last one is the final point
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        ax, ay = x[previous], y[previous]
+        # Twice the triangle area; the constant factor doesn't change the argmax
+        area = np.abs((ax - next_x[bucket]) * (y[start:stop] - ay)
+                      - (ax - x[start:stop]) * (next_y[bucket] - ay))
+        previous = start + int(area.argmax())
+        selected[bucket + 1] = previous
+    return selected
+
+def pixel_budget(width_px, method="lttb"):
+    """Number of points worth drawing across width_px pixels."""
+    return max(3, int(width_px * POINTS_PER_PIXEL[method]))
+
+def payload_budget(n_traces, max_bytes=DEFAULT_MAX_PAYLOAD_BYTES):
+    """Points per trace that keep n_traces traces within max_bytes."""
+    return max(3, int(max_bytes / (BYTES_PER_POINT * max(1, n_traces))))
+
+def downsample(x, y, max_points, method="lttb", log_y=False):
+    """Reduce (x, y) to at most about max_points points with the given method.
+
+    log_y selects points by log10(y), for charts with a logarithmic y axis.
+    """
+    key = np.log10(y) if log_y else y
+    if method == "minmax":
+        indices = minmax_indices(key, max_points)
+    else:
+        indices = lttb_indices(x, key, max_points)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+def plotly_trace(x, y, max_points, method="lttb", log_y=False, **trace_kwargs):
+    """Downsampled float32 Plotly trace."""
+    import plotly.graph_objects as go
+    x, y = downsample(x, y, max_points, method, log_y)
+    return go.Scatter(x=x.astype(np.float32), y=y.astype(np.float32), **trace_kwargs)
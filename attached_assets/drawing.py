@@ -0,0 +1,79 @@
+"""
+Batched drawing helpers for the matplotlib slides.
+
+Matplotlib draws each artist on its own, paying for its transform, clip path and
+graphics context every time. Repeated primitives such as grid lines, bars and
+patches are drawn here as a single collection artist instead of one artist each.
+Text has no collection equivalent, so labels are still one artist apiece.
+"""
+
+import numpy as np
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+
+def grid_lines(ax, xs=(), ys=(), **style):
+    """Draw full-height vertical lines at xs and full-width horizontal lines at ys.
+
+    The batched equivalent of calling ax.axvline / ax.axhline per position: at most
+    two artists, whatever the number of lines. Returns the collections added.
+    """
+    collections = []
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if xs.size:
+        # x in data coordinates, y in axes coordinates, like axvline
+        segments = np.stack([np.stack([xs, np.zeros_like(xs)], -1),
+                             np.stack([xs, np.ones_like(xs)], -1)], axis=1)
+        collections.append(ax.add_collection(
+            LineCollection(segments, transform=ax.get_xaxis_transform(), **style),
+            autolim=False))
+    if ys.size:
+        segments = np.stack([np.stack([np.zeros_like(ys), ys], -1),
+                             np.stack([np.ones_like(ys), ys], -1)], axis=1)
+        collections.append(ax.add_collection(
+            LineCollection(segments, transform=ax.get_yaxis_transform(), **style),
+            autolim=False))
+    return collections
+
+def _rectangles(ax, left, bottom, width, height, **style):
+    left, bottom, width, height = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (left, bottom, width, height)))
+    right, top = left + width, bottom + height
+    verts = np.stack([np.stack([left, bottom], -1), np.stack([left, top], -1),
+                      np.stack([right, top], -1), np.stack([right, bottom], -1)], axis=1)
+    style.setdefault("facecolor", "C0")
+    return ax.add_collection(PolyCollection(verts, **style))
+
+def bars(ax, positions, heights, width=0.8, bottom=0, **style):
+    """Draw vertical bars centred on positions as one artist.
+
+    Style keywords are PolyCollection's (facecolor, edgecolor, label, ...); a label
+    shows up in the legend like ax.bar's.
+    """
+    positions = np.asarray(positions, dtype=float)
+    collection = _rectangles(ax, positions - width / 2, bottom, width, heights, **style)
+    # Like ax.bar: no margin between the bars and their baseline
+    collection.sticky_edges.y.append(bottom)
+    ax.autoscale_view()
+    return collection
+
+def hbars(ax, positions, widths, height=0.8, left=0, **style):
+    """Draw horizontal bars centred on positions as one artist (see bars)."""
+    positions = np.asarray(positions, dtype=float)
+    collection = _rectangles(ax, left, positions - height / 2, widths, height, **style)
+    collection.sticky_edges.x.append(left)
+    ax.autoscale_view()
+    return collection
+
+def patches(ax, shapes, **style):
+    """Add matplotlib patches as one collection, keeping each patch's own colours."""
+    collection = ax.add_collection(PatchCollection(shapes, match_original=True, **style))
+    ax.autoscale_view()
+    return collection
+
+def artist_count(fig):
+    """Number of data artists (lines, collections, patches, text, images) in a figure."""
+    count = len(fig.texts) + len(fig.patches) + len(fig.lines)
+    for ax in fig.axes:
+        count += (len(ax.lines) + len(ax.collections) + len(ax.patches) + len(ax.texts)
+                  + len(ax.images) + len(ax.artists))
+    return count
@@ -0,0 +1,177 @@
+"""
+Monte Carlo ensembles of noisy energy series, with constant memory.
+
+Each realization is E(t) = mean(t) + scale(t) z with standard normal z, sampled at
+the same n_times instants. run() generates N realizations in chunks of about
+CHUNK_VALUES numbers on a thread pool and folds every chunk into an EnsembleStats:
+
+- mean and variance per instant, merged with Welford/Chan's parallel update
+- a fixed-bin histogram per instant (HISTOGRAM_BINS bins spanning ±HISTOGRAM_RANGE
+  scales around the mean), from which percentile bands are interpolated
+
+Only a bounded number of chunks is in flight, so memory depends on n_times but
+not on N. Chunk i always draws from generator(seed, i), so the result does not
+depend on the number of workers.
+"""
+
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+import numpy as np
+
+from random_streams import DEFAULT_SEED, generator
+
+# Random numbers generated per chunk (8 MB of float64)
+CHUNK_VALUES = 1_000_000
+
+# Histogram bins per instant, spanning mean ± HISTOGRAM_RANGE * scale; samples
+# beyond that range are counted in the outermost bins
+HISTOGRAM_BINS = 100
+HISTOGRAM_RANGE = 6.0
+
+# Percentiles reported by summarize()
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Callable run as progress(done, total, stats) after every merged chunk, for
+# streaming partial results; set by the caller around a run()
+progress_callback = ContextVar("progress_callback", default=None)
+
+Summary = namedtuple("Summary", ["count", "mean", "std", "bands"])
+
+# ΔE·Δt against ħ/2: the products, which instants satisfy the bound (within three
+# standard errors of the estimated ΔE), and the shortest Δt from which it always holds
+BoundCheck = namedtuple("BoundCheck", ["product", "satisfied", "fraction", "holds_from"])
+
+
+class EnsembleStats:
+    """Streaming per-instant statistics of an ensemble; memory independent of its size."""
+
+    def __init__(self, mean, scale):
+        self.centre = np.asarray(mean, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+        n_times = len(self.scale)
+        self.count = 0
+        self.mean = np.zeros(n_times)
+        self.m2 = np.zeros(n_times)
+        self.histogram = np.zeros((n_times, HISTOGRAM_BINS), dtype=np.int64)
+
+    def add_samples(self, values):
+        """Fold a (realizations, n_times) block of samples into the statistics."""
+        count = len(values)
+        mean = values.mean(axis=0)
+        m2 = ((values - mean) ** 2).sum(axis=0)
+
+        # Bin each sample in units of its instant's scale; one bincount for the block
+        z = (values - self.centre) / self.scale
+        bins = ((z + HISTOGRAM_RANGE) * (HISTOGRAM_BINS / (2 * HISTOGRAM_RANGE))).astype(np.intp)
+        np.clip(bins, 0, HISTOGRAM_BINS - 1, out=bins)
+        bins += np.arange(len(self.scale)) * HISTOGRAM_BINS
+        counts = np.bincount(bins.ravel(), minlength=self.histogram.size)
+        self._merge(count, mean, m2, counts.reshape(self.histogram.shape))
+
+    def merge(self, other):
+        """Fold another EnsembleStats over the same instants into this one."""
+        self._merge(other.count, other.mean, other.m2, other.histogram)
+
+    def _merge(self, count, mean, m2, histogram):
+        total = self.count + count
+        if total == 0:
+            return
+        delta = mean - self.mean
+        self.mean += delta * (count / total)
+        self.m2 += m2 + delta ** 2 * (self.count * count / total)
+        self.count = total
+        self.histogram += histogram
+
+    @property
+    def std(self):
+        """Sample standard deviation per instant: the ensemble's ΔE(t)."""
+        return np.sqrt(self.m2 / max(1, self.count - 1))
+
+    def percentiles(self, percents):
+        """Percentiles per instant, interpolated linearly within histogram bins."""
+        cumulative = np.cumsum(self.histogram, axis=1)
+        width = 2 * HISTOGRAM_RANGE / HISTOGRAM_BINS
+        result = {}
+        for percent in percents:
+            target = percent / 100 * self.count
+            index = (cumulative < target).sum(axis=1)
+            index = np.minimum(index, HISTOGRAM_BINS - 1)
+            rows = np.arange(len(index))
+            below = np.where(index > 0, cumulative[rows, index - 1], 0)
+            in_bin = np.maximum(self.histogram[rows, index], 1)
+            z = -HISTOGRAM_RANGE + (index + (target - below) / in_bin) * width
+            result[percent] = self.centre + self.scale * z
+        return result
+
+
+def _chunk(mean, scale, seed, index, rows):
+    """Statistics of one chunk of realizations, drawn from its own random stream."""
+    stats = EnsembleStats(mean, scale)
+    values = generator(seed, index).standard_normal((rows, len(scale)))
+    values *= stats.scale
+    values += stats.centre
+    stats.add_samples(values)
+    return stats
+
+
+def run(n_realizations, mean, scale, seed=DEFAULT_SEED, workers=None, chunk_values=CHUNK_VALUES):
+    """Generate n_realizations series on a thread pool and return their EnsembleStats.
+
+    Calls the current progress_callback, if any, after every merged chunk.
+    """
+    scale = np.asarray(scale, dtype=float)
+    mean = np.broadcast_to(np.asarray(mean, dtype=float), scale.shape)
+    rows = max(1, chunk_values // len(scale))
+    sizes = [min(rows, n_realizations - start) for start in range(0, n_realizations, rows)]
+    workers = workers or os.cpu_count() or 1
+    progress = progress_callback.get()
+
+    stats = EnsembleStats(mean, scale)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # At most two chunks per worker in flight keeps memory flat; merging in
+        # submission order keeps the floating-point result reproducible
+        chunks = iter(enumerate(sizes))
+        pending = deque()
+
+        def submit_next():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(pool.submit(_chunk, mean, scale, seed, *chunk))
+
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            stats.merge(pending.popleft().result())
+            submit_next()
+            if progress is not None:
+                progress(stats.count, n_realizations, stats)
+    return stats
+
+
+def summarize(stats, percents=BAND_PERCENTILES):
+    """Count, mean, ΔE and percentile bands of an ensemble."""
+    return Summary(stats.count, stats.mean.copy(), stats.std, stats.percentiles(percents))
+
+
+def bound_check(times, std, count, hbar=1.0):
+    """Compare the ensemble's ΔE(Δt)·Δt with ħ/2 at every instant.
+
+    An instant passes unless ΔE is below ħ/(2Δt) by more than three standard errors
+    (ΔE / sqrt(2(N - 1)) for a normal sample), so sampling noise alone never fails it.
+    """
+    times = np.asarray(times, dtype=float)
+    product = std * times
+    standard_error = std / np.sqrt(2 * max(1, count - 1))
+    satisfied = (std + 3 * standard_error) * times >= hbar / 2
+    failing = np.flatnonzero(~satisfied)
+    if len(failing) == 0:
+        holds_from = times[0]
+    elif failing[-1] + 1 < len(times):
+        holds_from = times[failing[-1] + 1]
+    else:
+        holds_from = np.nan
+    return BoundCheck(product, satisfied, satisfied.mean(), holds_from)
+
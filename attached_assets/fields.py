@@ -0,0 +1,140 @@
+"""
+Field generators for the quantum vacuum visualizations.
+
+The vacuum surface is a sum of isotropic Gaussian bumps. Each bump factorizes into
+a function of x times a function of y, so the whole field is a single matrix
+product of two small per-axis tables instead of one full-grid temporary per bump.
+Work is tiled over bumps and grid rows, which keeps peak memory bounded for large
+grids and thousands of bumps.
+
+The alternative is a stationary Gaussian random field with a chosen power spectrum
+P(k): white, a power law k^-n, or flat within a band of wavenumbers. Random Fourier
+amplitudes are shaped by sqrt(P(k)) and transformed back with one inverse real FFT,
+so a field costs O(N log N) in its N grid points, however much structure it holds.
+FFT fields are periodic over their extent, so tile() lays copies side by side without
+seams. Each mode also oscillates at ω(k) = sqrt(k² + m²), like a free field of mass m,
+and any frame of the evolution is another inverse FFT.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Largest number of array elements any temporary may hold (16 MB in float32)
+DEFAULT_TILE_ELEMENTS = 4 * 1024 * 1024
+
+def gaussian_bumps(x, y, centers, sigmas, amplitudes, dtype=np.float64,
+                   tile_elements=DEFAULT_TILE_ELEMENTS):
+    """Evaluate a sum of Gaussian bumps on the grid spanned by the 1D axes x and y.
+
+    centers has shape (n, 2) holding (x0, y0); sigmas and amplitudes have shape (n,).
+    Returns an array of shape (len(y), len(x)), laid out like np.meshgrid(x, y).
+    """
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
+    centers = np.asarray(centers, dtype=dtype).reshape(-1, 2)
+    sigmas = np.asarray(sigmas, dtype=dtype)
+    amplitudes = np.asarray(amplitudes, dtype=dtype)
+
+    field = np.zeros((len(y), len(x)), dtype=dtype)
+    n_bumps = len(sigmas)
+    if n_bumps == 0:
+        return field
+
+    # Tile sizes: bump chunks bound the per-axis tables, row blocks bound the product
+    bump_chunk = max(1, tile_elements // max(len(x), len(y)))
+    row_block = max(1, tile_elements // max(len(x), 1))
+
+    for start in range(0, n_bumps, bump_chunk):
+        chunk = slice(start, start + bump_chunk)
+        inv_two_sigma_sq = 1 / (2 * sigmas[chunk] ** 2)
+        # Per-axis factors, shape (bumps, nx) and (bumps, ny); amplitude folded into y
+        gx = np.exp(-(x[None, :] - centers[chunk, 0, None]) ** 2 * inv_two_sigma_sq[:, None])
+        gy = np.exp(-(y[None, :] - centers[chunk, 1, None]) ** 2 * inv_two_sigma_sq[:, None])
+        gy *= amplitudes[chunk, None]
+        for row in range(0, len(y), row_block):
+            rows = slice(row, row + row_block)
+            field[rows] += gy[:, rows].T @ gx
+
+    return field
+
+def random_bump_parameters(rng, n_bumps, extent=10.0):
+    """Draw centers, widths and amplitudes for virtual particle pairs inside [0, extent].
+
+    rng is a numpy.random.Generator (see random_streams.generator).
+    """
+    centers = rng.uniform(0, extent, size=(n_bumps, 2))
+    sigmas = rng.uniform(0.2, 0.4, size=n_bumps)
+    amplitudes = rng.uniform(0.5, 1.0, size=n_bumps)
+    return centers, sigmas, amplitudes
+
+SPECTRA = ("white", "power_law", "band")
+
+# Fourier modes of a random field on a half-plane of wavenumbers (as np.fft.rfft2
+# lays them out): two independent sets of amplitudes and each mode's frequency
+SpectralModes = namedtuple("SpectralModes", ["shape", "cosine", "sine", "frequency"])
+
+def spectral_amplitude(k, spectrum="power_law", index=2.0, band=(1.0, 4.0)):
+    """sqrt(P(k)) for a spectrum in SPECTRA; zero at k = 0, so fields have zero mean."""
+    k = np.asarray(k)
+    if spectrum == "white":
+        amplitude = np.ones_like(k)
+    elif spectrum == "power_law":
+        with np.errstate(divide="ignore"):
+            amplitude = k ** (-index / 2)
+    elif spectrum == "band":
+        amplitude = ((k >= band[0]) & (k <= band[1])).astype(k.dtype)
+    else:
+        raise ValueError(f"Unknown spectrum {spectrum!r}; expected one of {SPECTRA}")
+    amplitude[k == 0] = 0
+    return amplitude
+
+def spectral_modes(rng, shape, extent=10.0, spectrum="power_law", index=2.0, band=(1.0, 4.0),
+                   mass=1.0, dtype=np.float32):
+    """Draw the Fourier modes of a random field of shape (ny, nx) over [0, extent]².
+
+    The field at time t is field_at(modes, t), with the given spectrum and unit
+    variance on average at every t. rng is a numpy.random.Generator (see
+    random_streams.generator).
+    """
+    ny, nx = shape
+    kx = 2 * np.pi * np.fft.rfftfreq(nx, d=extent / nx).astype(dtype)
+    ky = 2 * np.pi * np.fft.fftfreq(ny, d=extent / ny).astype(dtype)
+    k = np.hypot(ky[:, None], kx[None, :])
+    amplitude = spectral_amplitude(k, spectrum, index, band)
+
+    # Columns other than kx = 0 and the Nyquist column stand for two modes each
+    weight = np.full(len(kx), 2.0, dtype=dtype)
+    weight[0] = 1
+    if nx % 2 == 0:
+        weight[-1] = 1
+    power = (amplitude**2 * weight).sum()
+    if power == 0:
+        raise ValueError("The spectrum has no power on this grid")
+    # Transforms of real white noise have the Hermitian symmetry of a real field
+    amplitude *= np.sqrt(nx * ny / power)
+    cosine, sine = (np.fft.rfft2(rng.standard_normal(shape, dtype=dtype)) * amplitude
+                    for _ in range(2))
+    return SpectralModes(shape, cosine, sine, np.sqrt(k**2 + mass**2))
+
+def field_at(modes, t=0.0):
+    """The field of modes at time t, of shape modes.shape."""
+    phase = modes.frequency * modes.frequency.dtype.type(t)
+    spectrum = modes.cosine * np.cos(phase) + modes.sine * np.sin(phase)
+    return np.fft.irfft2(spectrum, s=modes.shape)
+
+def gaussian_random_field(rng, shape, extent=10.0, spectrum="power_law", index=2.0,
+                          band=(1.0, 4.0), dtype=np.float32):
+    """A periodic, zero-mean, unit-variance Gaussian random field of shape (ny, nx)."""
+    return field_at(spectral_modes(rng, shape, extent, spectrum, index, band, dtype=dtype))
+
+def tile(field, extent=10.0, copies=2):
+    """Repeat a periodic field copies times along each axis.
+
+    Returns the 1D axes x and y of the tiled grid, covering [0, copies * extent), and
+    the tiled field of shape (copies * ny, copies * nx) in the field's dtype.
+    """
+    ny, nx = field.shape
+    x = np.arange(copies * nx, dtype=field.dtype) * field.dtype.type(extent / nx)
+    y = np.arange(copies * ny, dtype=field.dtype) * field.dtype.type(extent / ny)
+    return x, y, np.tile(field, (copies, copies))
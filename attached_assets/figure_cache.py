@@ -0,0 +1,233 @@
+"""
+Process-wide cache for rendered presentation figures.
+
+Figures are keyed by (builder, parameters, language, theme) and shared by every
+session in the server process, so viewers of the same slide pay the build cost once.
+"""
+
+import inspect
+import io
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import wraps
+
+import streamlit as st
+
+import instrumentation
+import render_pool
+from plotly_payload import compact_figure
+from render_scheduler import scheduler
+
+# Default bounds for the shared cache
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Streamlit's own savefig defaults, so cached images look the same as st.pyplot output
+PNG_SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200, "format": "png"}
+
+_MISSING = object()
+
+# Callables run as observer(fig, png, seconds) after every rasterization; the
+# headless harness uses this to count artists and time drawing
+png_observers = []
+
+
+class FigureCache:
+    """Thread-safe LRU cache bounded by entry count and total payload bytes."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size in bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for key, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        """Store a value, evicting least recently used entries to respect the bounds."""
+        if nbytes is None:
+            nbytes = figure_nbytes(value)
+        if nbytes > self.max_bytes:
+            # Never let a single oversized figure flush the whole cache
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self.evictions += 1
+
+    def get_or_create(self, key, factory):
+        """Return the cached value for key, building and storing it on a miss.
+
+        Concurrent misses for one key share a single build, and builds are admitted
+        by render_scheduler.scheduler (which may raise Overloaded for prefetches).
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = scheduler.run(key, lambda: self._create(key, factory))
+        return value
+
+    def _create(self, key, factory):
+        # Another build of key may have been stored between the miss and now
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return entry[0]
+        value = factory()
+        self.put(key, value)
+        return value
+
+    def nbytes(self, value):
+        """Payload size stored with value's entry, or None if value is not cached."""
+        with self._lock:
+            for cached, nbytes in self._entries.values():
+                if cached is value:
+                    return nbytes
+        return None
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# The cache shared by every session in this process
+figure_cache = FigureCache()
+
+
+def figure_nbytes(value):
+    """Estimate the payload size of a cached figure."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(figure_nbytes(item) for item in value)
+    # Plotly figures are shipped to the browser as JSON
+    return len(value.to_json())
+
+
+def figure_png(fig):
+    """Rasterize a matplotlib figure to PNG bytes, in a worker process when render_pool is enabled."""
+    start = time.perf_counter()
+    png = render_pool.rasterize(fig, PNG_SAVEFIG_OPTIONS) if render_pool.enabled() else None
+    if png is None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **PNG_SAVEFIG_OPTIONS)
+        png = buffer.getvalue()
+    seconds = time.perf_counter() - start
+    if instrumentation.enabled:
+        instrumentation.record("serialize", "png", seconds, len(png))
+    for observer in png_observers:
+        observer(fig, png, seconds)
+    return png
+
+
+# (language, theme) for builds that run outside a script, such as prefetches
+render_settings = ContextVar("render_settings", default=None)
+
+
+def _current_language():
+    """Return the language of the current session."""
+    return st.session_state.get("language", "en")
+
+
+def _current_theme():
+    """Return the active theme name ("light", "dark" or the configured base)."""
+    try:
+        theme_type = st.context.theme.type
+    except AttributeError:
+        theme_type = None
+    return theme_type or st.get_option("theme.base") or "light"
+
+
+def current_settings():
+    """Return the (language, theme) that figures built on this thread are cached for."""
+    settings = render_settings.get()
+    if settings is None:
+        settings = (_current_language(), _current_theme())
+    return settings
+
+
+def _compacted(figure):
+    if isinstance(figure, (bytes, bytearray, tuple)):
+        return figure
+    return compact_figure(figure)
+
+
+def cached_figure(builder=None, *, per_language=True):
+    """Decorate a deterministic figure builder so its result is shared across sessions.
+
+    The builder's arguments must be hashable; defaults are filled in before keying,
+    so f() and f(<default>) share an entry. Matplotlib builders should return
+    PNG bytes (see figure_png); Plotly builders return the figure itself, which is
+    compacted once before caching (see plotly_payload.compact_figure). Pass
+    per_language=False for figures without translated text, so every language
+    shares one cached copy.
+    """
+    if builder is None:
+        return lambda func: cached_figure(func, per_language=per_language)
+
+    signature = inspect.signature(builder)
+
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        language, theme = current_settings()
+        key = (
+            builder.__module__,
+            builder.__qualname__,
+            tuple(bound.arguments.items()),
+            language if per_language else None,
+            theme,
+        )
+        return figure_cache.get_or_create(key, lambda: _compacted(builder(*args, **kwargs)))
+
+    return wrapper
+
+
+def show_figure(figure):
+    """Display a cached figure: PNG bytes as an image, anything else as a Plotly chart."""
+    if isinstance(figure, (bytes, bytearray)):
+        st.image(figure, use_container_width=True)
+    else:
+        start = time.perf_counter()
+        st.plotly_chart(figure, use_container_width=True)
+        if instrumentation.enabled:
+            # The size measured when the figure was cached; None for an uncached figure
+            instrumentation.record("serialize", "plotly", time.perf_counter() - start,
+                                   figure_cache.nbytes(figure))
@@ -0,0 +1,96 @@
+"""
+Lifecycle management for matplotlib figures.
+
+Figures are created directly on an Agg canvas instead of through pyplot, so the
+global pyplot figure manager never holds on to them. The subplots() context
+manager hands out a figure for one render and takes it back afterwards: the
+figure is cleared and kept in a small pool, so the next render of the same size
+reuses its canvas and cached Agg renderer instead of allocating new ones.
+"""
+
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Idle figures kept per (figsize, dpi); extra figures are left to the garbage collector
+MAX_POOLED_PER_SIZE = 4
+
+_pool = {}
+_live = weakref.WeakSet()
+_lock = threading.Lock()
+_counters = {"created": 0, "reused": 0, "released": 0}
+
+def new_figure(figsize=None, dpi=None):
+    """Create a figure on its own Agg canvas, outside pyplot's figure manager."""
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    with _lock:
+        _live.add(fig)
+        _counters["created"] += 1
+    return fig
+
+def _pool_key(figsize, dpi):
+    return (tuple(figsize) if figsize is not None else None, dpi)
+
+def _acquire(figsize, dpi):
+    """Take an idle figure of the right size from the pool, or create one."""
+    key = _pool_key(figsize, dpi)
+    with _lock:
+        idle = _pool.get(key)
+        if idle:
+            _counters["reused"] += 1
+            return idle.pop()
+    return new_figure(figsize=figsize, dpi=dpi)
+
+def _release(fig, figsize, dpi):
+    """Clear a figure after rendering and return it to the pool."""
+    fig.clear()
+    fig.subplotpars.reset()
+    fig.set_layout_engine("none")
+    key = _pool_key(figsize, dpi)
+    with _lock:
+        _counters["released"] += 1
+        idle = _pool.setdefault(key, [])
+        if len(idle) < MAX_POOLED_PER_SIZE:
+            idle.append(fig)
+
+@contextmanager
+def subplots(nrows=1, ncols=1, figsize=None, dpi=None, **subplot_kwargs):
+    """Context-managed replacement for plt.subplots().
+
+    Yields (fig, axes) like plt.subplots(); the figure is released when the block
+    exits, so display it (st.pyplot, figure_png, ...) inside the block.
+    """
+    fig = _acquire(figsize, dpi)
+    try:
+        axes = fig.subplots(nrows, ncols, **subplot_kwargs)
+        yield fig, axes
+    finally:
+        _release(fig, figsize, dpi)
+
+def _renderer_nbytes(fig):
+    """Size of the Agg pixel buffer currently cached by a figure's canvas."""
+    renderer = getattr(fig.canvas, "renderer", None)
+    if renderer is None:
+        return 0
+    return int(renderer.width) * int(renderer.height) * 4
+
+def stats():
+    """Report live figure counts and the bytes held by their Agg buffers."""
+    with _lock:
+        live = list(_live)
+        pooled = sum(len(idle) for idle in _pool.values())
+        counters = dict(_counters)
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    return {
+        "live": len(live),
+        "in_use": len(live) - pooled,
+        "pooled": pooled,
+        "bytes": sum(_renderer_nbytes(fig) for fig in live),
+        "pyplot_open": len(pyplot.get_fignums()) if pyplot is not None else 0,
+        **counters,
+    }
@@ -0,0 +1,385 @@
+"""
+Headless stand-in for the Streamlit API.
+
+recording() swaps a RecordingStreamlit object in for the `st` module used by the
+presentation modules, so slide functions can run outside a Streamlit server. Every
+element a slide emits is recorded in order, with the size of its serialized
+payload and the time spent producing it; widgets return their default values, or
+the value held under their key in session state.
+
+run() times a single call (any slide or visualization function), run_app()
+executes the whole app.py script. Both return a RenderReport.
+
+Usage:
+    python headless.py <section_id | module:function | app.py> [--section ID]
+                       [--language so] [--repeat N] [--no-cache] [--profile]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import textwrap
+import time
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import streamlit
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(ASSETS_DIR, "app.py")
+
+# nbytes is the serialized payload size, seconds the time the st call took
+# (figure serialization, mostly)
+Element = namedtuple("Element", ["kind", "payload", "nbytes", "seconds"], defaults=(0, 0.0))
+
+# Elements recorded as plain text, with the kind they map to
+TEXT_ELEMENTS = ("title", "header", "subheader", "caption", "text", "latex", "code")
+
+# Element kinds that carry a figure
+FIGURE_KINDS = ("image", "plotly")
+
+# A matplotlib figure rasterized during a recording: artist count, PNG size and
+# the time savefig took (drawing plus PNG encoding)
+Raster = namedtuple("Raster", ["artists", "nbytes", "seconds"])
+
+
+def _text_nbytes(value):
+    return len(str(value).encode())
+
+
+def _table_nbytes(data):
+    """Size of a table as Streamlit sends it: an Arrow IPC stream."""
+    import pandas as pd
+    import pyarrow as pa
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data)
+    table = pa.Table.from_pandas(data)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def _plotly_nbytes(figure):
+    """Size of a Plotly figure as Streamlit serializes it."""
+    import plotly.io
+    return len(plotly.io.to_json(figure, validate=False))
+
+
+class SessionState(dict):
+    """Dict with attribute access, like st.session_state."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class _Container:
+    """A column or expander: records into the owning recorder."""
+
+    def __init__(self, recorder):
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._recorder, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class RecordingStreamlit:
+    """Records the elements a slide emits instead of sending them to a browser."""
+
+    def __init__(self, language="en", session_state=None):
+        self.elements = []
+        self.rasters = []
+        self.session_state = SessionState(language=language)
+        self.session_state.update(session_state or {})
+        self.context = SimpleNamespace(theme=SimpleNamespace(type="light"))
+        self.query_params = {}
+
+    @property
+    def sidebar(self):
+        return _Container(self)
+
+    def _observe_raster(self, fig, png, seconds):
+        from drawing import artist_count
+        self.rasters.append(Raster(artist_count(fig), len(png), seconds))
+
+    def _record(self, kind, payload=None, nbytes=0, seconds=0.0):
+        self.elements.append(Element(kind, payload, nbytes, seconds))
+
+    def _record_timed(self, kind, payload, measure):
+        """Record payload with the size measure() reports and the time it took."""
+        start = time.perf_counter()
+        nbytes = measure(payload)
+        self._record(kind, payload, nbytes, time.perf_counter() - start)
+
+    # Text and data elements
+
+    def markdown(self, body, unsafe_allow_html=False, **kwargs):
+        self._record_timed("markdown", textwrap.dedent(body), _text_nbytes)
+
+    def write(self, *args, **kwargs):
+        for arg in args:
+            if isinstance(arg, str):
+                self.markdown(arg)
+            else:
+                self.table(arg)
+
+    def table(self, data=None, **kwargs):
+        self._record_timed("table", data, _table_nbytes)
+
+    dataframe = table
+
+    def __getattr__(self, name):
+        if name in TEXT_ELEMENTS:
+            return lambda body, *args, **kwargs: self._record_timed(name, body, _text_nbytes)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # Anything else (st.info, st.divider, ...) is recorded by name
+        return lambda *args, **kwargs: self._record(name, args[0] if args else None)
+
+    # Figures
+
+    def pyplot(self, fig=None, **kwargs):
+        from figure_cache import figure_png
+        start = time.perf_counter()
+        png = figure_png(fig)
+        self._record("image", png, len(png), time.perf_counter() - start)
+
+    def image(self, image, **kwargs):
+        self._record_timed("image", image, len)
+
+    def plotly_chart(self, figure_or_data, **kwargs):
+        self._record_timed("plotly", figure_or_data, _plotly_nbytes)
+
+    # Widgets return their defaults, or the value already stored under their key
+
+    def _widget(self, label, value, key):
+        if key is not None:
+            value = self.session_state.setdefault(key, value)
+        self._record("widget", (label, value))
+        return value
+
+    def slider(self, label, min_value=None, max_value=None, value=None, step=None, key=None, **kwargs):
+        return self._widget(label, min_value if value is None else value, key)
+
+    def selectbox(self, label, options, index=0, key=None, **kwargs):
+        value = list(options)[index] if index is not None else None
+        return self._widget(label, value, key)
+
+    radio = selectbox
+
+    def select_slider(self, label, options=(), value=None, key=None, **kwargs):
+        return self._widget(label, list(options)[0] if value is None else value, key)
+
+    def checkbox(self, label, value=False, key=None, **kwargs):
+        return self._widget(label, value, key)
+
+    toggle = checkbox
+
+    # Layout and app control
+
+    def columns(self, spec, **kwargs):
+        count = spec if isinstance(spec, int) else len(spec)
+        return [_Container(self) for _ in range(count)]
+
+    def expander(self, label, expanded=False, **kwargs):
+        self._record("subheader", label)
+        return _Container(self)
+
+    def container(self, **kwargs):
+        return _Container(self)
+
+    def empty(self):
+        return _Container(self)
+
+    def progress(self, value=0, text=None):
+        self._record("progress", value)
+        return _Container(self)
+
+    def set_page_config(self, **kwargs):
+        pass
+
+    def rerun(self, **kwargs):
+        pass
+
+    def get_option(self, name):
+        return None
+
+    def fragment(self, func=None, **kwargs):
+        if func is None:
+            return lambda f: f
+        return func
+
+
+class RenderReport:
+    """Elements one call emitted, with its wall and CPU time."""
+
+    def __init__(self, name, elements, wall_seconds, cpu_seconds, result=None, rasters=()):
+        self.name = name
+        self.elements = elements
+        self.rasters = list(rasters)
+        self.wall_seconds = wall_seconds
+        self.cpu_seconds = cpu_seconds
+        self.result = result
+
+    @property
+    def figures(self):
+        return [element for element in self.elements if element.kind in FIGURE_KINDS]
+
+    @property
+    def figure_bytes(self):
+        return sum(element.nbytes for element in self.figures)
+
+    @property
+    def total_bytes(self):
+        return sum(element.nbytes for element in self.elements)
+
+    @property
+    def artists(self):
+        """Artists in every matplotlib figure rasterized during the call."""
+        return sum(raster.artists for raster in self.rasters)
+
+    @property
+    def draw_seconds(self):
+        """Time spent rasterizing matplotlib figures during the call."""
+        return sum(raster.seconds for raster in self.rasters)
+
+    def counts(self):
+        """Number of elements of each kind."""
+        return Counter(element.kind for element in self.elements)
+
+    def summary(self):
+        """Plain-text table of the emitted elements and the totals."""
+        lines = [f"{'#':>3}  {'kind':<10} {'bytes':>10} {'ms':>9}  preview"]
+        for index, element in enumerate(self.elements):
+            preview = element.payload if element.kind not in FIGURE_KINDS else ""
+            preview = " ".join(str(preview).split())[:50]
+            lines.append(f"{index:>3}  {element.kind:<10} {element.nbytes:>10} "
+                         f"{element.seconds * 1000:>9.2f}  {preview}")
+        lines.append(f"{self.name}: {len(self.elements)} elements, "
+                     f"{len(self.figures)} figures ({self.figure_bytes} bytes), "
+                     f"{self.total_bytes} bytes total, wall {self.wall_seconds * 1000:.1f} ms, "
+                     f"CPU {self.cpu_seconds * 1000:.1f} ms")
+        if self.rasters:
+            lines.append(f"{len(self.rasters)} matplotlib figures drawn: {self.artists} artists, "
+                         f"{self.draw_seconds * 1000:.1f} ms in savefig")
+        return "\n".join(lines)
+
+
+@contextmanager
+def recording(language="en", session_state=None):
+    """Run the enclosed code against a RecordingStreamlit instead of Streamlit."""
+    recorder = RecordingStreamlit(language, session_state)
+    from figure_cache import png_observers
+    png_observers.append(recorder._observe_raster)
+    real = sys.modules["streamlit"]
+    for module in list(sys.modules.values()):
+        if getattr(module, "st", None) is streamlit:
+            module.st = recorder
+    # Modules imported inside the block pick up the recorder too
+    sys.modules["streamlit"] = recorder
+    try:
+        yield recorder
+    finally:
+        png_observers.remove(recorder._observe_raster)
+        sys.modules["streamlit"] = real
+        for module in list(sys.modules.values()):
+            if getattr(module, "st", None) is recorder:
+                module.st = streamlit
+
+
+def resolve(target):
+    """Return the function a section ID or "module:function" string names."""
+    if ":" in target:
+        module_name, function_name = target.split(":", 1)
+        return getattr(importlib.import_module(module_name), function_name)
+    from sections import load_section
+    return load_section(target)
+
+
+def run(func, *args, language="en", session_state=None, name=None, **kwargs):
+    """Call func(*args, **kwargs) headlessly and report what it emitted."""
+    with recording(language, session_state) as recorder:
+        wall, cpu = time.perf_counter(), time.process_time()
+        result = func(*args, **kwargs)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return RenderReport(name or getattr(func, "__qualname__", repr(func)),
+                        recorder.elements, wall, cpu, result, recorder.rasters)
+
+
+def run_app(section=None, language="en", path=APP_PATH):
+    """Execute the whole app script once, showing section (default: the first)."""
+    with open(path, encoding="utf-8") as source:
+        code = compile(source.read(), path, "exec")
+    state = {"section": section} if section else {}
+    return run(exec, code, {"__name__": "__main__", "__file__": path},
+               language=language, session_state=state,
+               name=f"{os.path.basename(path)}:{section or 'default'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a slide or the whole app without a Streamlit server.")
+    parser.add_argument("target", help='section ID, "module:function", or app.py')
+    parser.add_argument("--section", default=None, help="section to show when running app.py")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--repeat", type=int, default=1, help="number of runs to time")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="clear the figure cache before every run")
+    parser.add_argument("--profile", action="store_true", help="print a cProfile of the last run")
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use("Agg")
+    sys.path.insert(0, ASSETS_DIR)
+
+    if args.target.endswith(".py"):
+        path = os.path.abspath(args.target)
+        call = lambda: run_app(args.section, args.language, path)
+    else:
+        func = resolve(args.target)
+        call = lambda: run(func, language=args.language, name=args.target)
+
+    for index in range(args.repeat):
+        if args.no_cache:
+            from figure_cache import figure_cache
+            figure_cache.clear()
+        profiler = None
+        if args.profile and index == args.repeat - 1:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+        report = call()
+        if profiler is not None:
+            profiler.disable()
+        if index == args.repeat - 1:
+            print(report.summary())
+        else:
+            print(f"run {index + 1}: wall {report.wall_seconds * 1000:.1f} ms, "
+                  f"CPU {report.cpu_seconds * 1000:.1f} ms")
+
+    if profiler is not None:
+        import pstats
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
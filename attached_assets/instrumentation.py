@@ -0,0 +1,163 @@
+"""
+Opt-in render-time instrumentation.
+
+Set PRESENTATION_METRICS to enable it: "1" (or "stderr") writes JSON lines to
+stderr, any other value is taken as a file path to append them to. Each line is
+one timed event:
+
+    {"ts": ..., "session": ..., "section": ..., "language": ...,
+     "event": "script" | "section" | "visualization" | "serialize",
+     "name": ..., "seconds": ..., "bytes": ...}
+
+Durations are also kept in process-wide rolling windows, shown per section by
+the hidden admin panel (open the app with ?metrics=1). Events recorded off the
+script thread, such as prefetch builds, have no "session" or "language" field.
+When the variable is not set, every hook reduces to a flag check.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+ENV_VAR = "PRESENTATION_METRICS"
+ADMIN_QUERY_PARAM = "metrics"
+SESSION_KEY = "_metrics_session_id"
+
+# Durations kept per (event, name) for the rolling percentiles
+WINDOW_SIZE = 500
+PERCENTILES = (50, 95, 99)
+
+_setting = os.environ.get(ENV_VAR, "")
+enabled = bool(_setting) and _setting != "0"
+
+# Section being rendered on this thread; set by sections.render_section
+current_section = ContextVar("current_section", default=None)
+
+_windows = defaultdict(lambda: deque(maxlen=WINDOW_SIZE))
+_lock = threading.Lock()
+_output = None
+
+
+def _stream():
+    global _output
+    if _output is None:
+        if _setting in ("1", "stderr"):
+            _output = sys.stderr
+        else:
+            _output = open(_setting, "a", encoding="utf-8", buffering=1)
+    return _output
+
+
+def _session_fields():
+    """Session ID and language of the running script; empty on threads without one."""
+    # Prefetch and render pool threads have no script run context, and so no session
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return {}
+    state = st.session_state
+    if SESSION_KEY not in state:
+        state[SESSION_KEY] = uuid.uuid4().hex[:12]
+    return {"session": state[SESSION_KEY], "language": state.get("language")}
+
+
+def record(event, name, seconds, nbytes=None, section=None):
+    """Log one timed event and add it to the rolling windows."""
+    line = json.dumps({
+        "ts": round(time.time(), 3),
+        **_session_fields(),
+        "section": section or current_section.get(),
+        "event": event,
+        "name": name,
+        "seconds": round(seconds, 6),
+        "bytes": nbytes,
+    })
+    with _lock:
+        _windows[event, name].append(seconds)
+        output = _stream()
+        output.write(line + "\n")
+
+
+class Timer:
+    """A running measurement; stop() records it."""
+
+    def __init__(self, event, name):
+        self.event = event
+        self.name = name
+        self.start = time.perf_counter()
+
+    def stop(self, nbytes=None, section=None):
+        if enabled:
+            record(self.event, self.name, time.perf_counter() - self.start, nbytes, section)
+
+
+def start(event, name):
+    """Start timing an event that doesn't fit in a with block, like the whole script."""
+    return Timer(event, name)
+
+
+@contextmanager
+def timed(event, name):
+    """Time the enclosed block. Set "bytes" on the yielded dict to log a payload size."""
+    fields = {}
+    if not enabled:
+        yield fields
+        return
+    begin = time.perf_counter()
+    yield fields
+    record(event, name, time.perf_counter() - begin, fields.get("bytes"))
+
+
+def instrumented(event):
+    """Decorate a function so every call is timed as event, named after the function."""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with timed(event, func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _percentile(ordered, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[index]
+
+
+def percentiles(event):
+    """Rolling count and p50/p95/p99 seconds for each name recorded under event."""
+    with _lock:
+        windows = {name: sorted(durations) for (kind, name), durations in _windows.items()
+                   if kind == event}
+    return {
+        name: (len(durations),) + tuple(_percentile(durations, p) for p in PERCENTILES)
+        for name, durations in sorted(windows.items())
+    }
+
+
+def admin_panel():
+    """Show rolling render percentiles in the sidebar when the app is opened with ?metrics=1."""
+    if not enabled or st.query_params.get(ADMIN_QUERY_PARAM) != "1":
+        return
+    with st.sidebar.expander("Render metrics", expanded=True):
+        for event in ("script", "section", "visualization", "serialize", "schedule", "prefetch"):
+            stats = percentiles(event)
+            if not stats:
+                continue
+            st.caption(event)
+            st.table([
+                {"name": name, "n": count,
+                 **{f"p{p} ms": round(value * 1000, 1) for p, value in zip(PERCENTILES, values)}}
+                for name, (count, *values) in stats.items()
+            ])
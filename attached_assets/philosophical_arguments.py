@@ -1,7 +1,9 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import drawing
+import figures
+from figure_cache import cached_figure, figure_png, show_figure
 from utils import display_slide_header, create_equation
 from translations import get_translation
 
@@ -9,6 +11,39 @@ def t(key):
     """Translate a key using the current language."""
     return get_translation(key, st.session_state.language)
 
+@cached_figure(per_language=False)
+def _philosophical_positions_figure():
+    """Build the chart of philosophical positions on energy conservation."""
+    with figures.subplots(figsize=(10, 7)) as (fig, ax):
+        positions = ['Realism', 'Instrumentalism', 'Structuralism', 'Constructivism']
+        descriptions = [
+            'Energy exists as a real\nphysical entity',
+            'Energy is a useful\naccounting construct',
+            'Energy represents structural\nrelations, not substances',
+            'Energy is a human\nconceptual framework'
+        ]
+        conservation_absolutism = [0.9, 0.3, 0.5, 0.1]  # Higher means more absolute
+        
+        # Create horizontal bars
+        y_pos = np.arange(len(positions))
+        drawing.hbars(ax, y_pos, conservation_absolutism)
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(positions)
+        
+        # Add descriptions
+        for i, desc in enumerate(descriptions):
+            ax.text(0.02, i, desc, va='center')
+        
+        # Add labels and title
+        ax.set_xlabel('Degree of Conservation Law Absolutism')
+        ax.set_title('Philosophical Positions on Energy Conservation')
+        ax.set_xlim(0, 1)
+        
+        # Invert axis to have realism at the top
+        ax.invert_yaxis()
+        
+        return figure_png(fig)
+
 def display_philosophical_argument_slide():
     """Display the philosophical arguments slide."""
     display_slide_header(t("philosophical_title"), 
@@ -33,37 +68,8 @@ def display_philosophical_argument_slide():
         - As Wittgenstein argued: the rules of a language game are not necessarily universal truths
     """)
     
-    # Create chart illustrating philosophical positions
-    fig, ax = plt.subplots(figsize=(10, 7))
-    
-    positions = ['Realism', 'Instrumentalism', 'Structuralism', 'Constructivism']
-    descriptions = [
-        'Energy exists as a real\nphysical entity',
-        'Energy is a useful\naccounting construct',
-        'Energy represents structural\nrelations, not substances',
-        'Energy is a human\nconceptual framework'
-    ]
-    conservation_absolutism = [0.9, 0.3, 0.5, 0.1]  # Higher means more absolute
-    
-    # Create horizontal bars
-    y_pos = np.arange(len(positions))
-    ax.barh(y_pos, conservation_absolutism, align='center')
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(positions)
-    
-    # Add descriptions
-    for i, desc in enumerate(descriptions):
-        ax.text(0.02, i, desc, va='center')
-    
-    # Add labels and title
-    ax.set_xlabel('Degree of Conservation Law Absolutism')
-    ax.set_title('Philosophical Positions on Energy Conservation')
-    ax.set_xlim(0, 1)
-    
-    # Invert axis to have realism at the top
-    ax.invert_yaxis()
-    
-    st.pyplot(fig)
+    # Chart illustrating philosophical positions
+    show_figure(_philosophical_positions_figure())
     
     st.markdown("""
     ### The Ontological Status of Energy
@@ -267,6 +273,41 @@ def display_philosophical_argument_slide():
     This suggests caution in asserting the absolute status of any scientific principle, including energy conservation.
     """)
 
+@cached_figure(per_language=False)
+def _bayesian_update_figure():
+    """Build the chart of beliefs about energy conservation updated on evidence."""
+    with figures.subplots(figsize=(10, 6)) as (fig, ax):
+        # Data for probabilistic belief update
+        evidence_points = ['Initial belief', 'Classical experiments', 'Special relativity', 
+                          'Quantum mechanics', 'General relativity', 'Cosmology', 'Current state']
+        
+        # Probabilities of absolute conservation after each evidence
+        absolute_probs = [0.5, 0.9, 0.85, 0.7, 0.5, 0.3, 0.2]
+        
+        # Probabilities of contextual conservation after each evidence
+        contextual_probs = [0.3, 0.35, 0.5, 0.65, 0.8, 0.9, 0.95]
+        
+        # Create x positions
+        x = np.arange(len(evidence_points))
+        width = 0.35
+        
+        # Create bars, one artist per series
+        drawing.bars(ax, x - width/2, absolute_probs, width, facecolor='C0',
+                     label='P(Absolute Conservation)')
+        drawing.bars(ax, x + width/2, contextual_probs, width, facecolor='C1',
+                     label='P(Contextual Conservation)')
+        
+        # Add labels and title
+        ax.set_ylabel('Probability')
+        ax.set_title('Bayesian Update of Beliefs About Energy Conservation')
+        ax.set_xticks(x)
+        ax.set_xticklabels(evidence_points, rotation=45, ha='right')
+        ax.legend()
+        
+        fig.tight_layout()
+        
+        return figure_png(fig)
+
 def display_logical_fallacies_slide():
     """Display the logical fallacies slide."""
     display_slide_header(t("logical_title"), 
@@ -328,37 +369,8 @@ def display_logical_fallacies_slide():
     We can apply Bayesian reasoning to energy conservation:
     """)
     
-    # Create a probability chart showing Bayesian update
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Data for probabilistic belief update
-    evidence_points = ['Initial belief', 'Classical experiments', 'Special relativity', 
-                      'Quantum mechanics', 'General relativity', 'Cosmology', 'Current state']
-    
-    # Probabilities of absolute conservation after each evidence
-    absolute_probs = [0.5, 0.9, 0.85, 0.7, 0.5, 0.3, 0.2]
-    
-    # Probabilities of contextual conservation after each evidence
-    contextual_probs = [0.3, 0.35, 0.5, 0.65, 0.8, 0.9, 0.95]
-    
-    # Create x positions
-    x = np.arange(len(evidence_points))
-    width = 0.35
-    
-    # Create bars
-    ax.bar(x - width/2, absolute_probs, width, label='P(Absolute Conservation)')
-    ax.bar(x + width/2, contextual_probs, width, label='P(Contextual Conservation)')
-    
-    # Add labels and title
-    ax.set_ylabel('Probability')
-    ax.set_title('Bayesian Update of Beliefs About Energy Conservation')
-    ax.set_xticks(x)
-    ax.set_xticklabels(evidence_points, rotation=45, ha='right')
-    ax.legend()
-    
-    plt.tight_layout()
-    
-    st.pyplot(fig)
+    # Probability chart showing Bayesian update
+    show_figure(_bayesian_update_figure())
     
     st.markdown("""
     This Bayesian analysis shows how rational belief in absolute conservation should decrease
@@ -552,6 +564,68 @@ def display_formal_logic_slide():
     3. Potential for revolutionary transition in scientific understanding
     """)
 
+@cached_figure(per_language=False)
+def _time_models_figure():
+    """Build the chart of models of time and the energy they allow to exist."""
+    with figures.subplots(figsize=(10, 6)) as (fig, ax):
+        # Data
+        time_models = ['Presentism', 'Growing Block', 'Eternalism', 'Block Universe']
+        implications = [
+            'Only present energy exists',
+            'Past & present energy exist',
+            'Past, present & future energy exist',
+            'Energy exists timelessly'
+        ]
+        compatibility = [0.7, 0.5, 0.3, 0.1]  # Compatibility with energy creation/destruction
+        
+        # Plot
+        y_pos = np.arange(len(time_models))
+        drawing.hbars(ax, y_pos, compatibility, facecolor='blue')
+        ax.set_yticks(y_pos, labels=time_models)
+        
+        # Add implications as text
+        for i, imp in enumerate(implications):
+            ax.text(0.02, i, imp, va='center', color='white')
+        
+        # Set labels
+        ax.set_xlabel('Compatibility with Energy Creation/Destruction')
+        ax.set_title('Philosophical Models of Time & Energy Existence')
+        
+        fig.tight_layout()
+        
+        return figure_png(fig)
+
+@cached_figure(per_language=False)
+def _conservation_scales_figure():
+    """Build the chart of how strongly conservation applies at each scale."""
+    # Levels of reality
+    levels = ['Quantum Scale', 'Particle Scale', 'Molecular Scale', 'Human Scale', 'Astronomical Scale', 'Cosmological Scale']
+    conservation_strength = [0.3, 0.7, 0.9, 0.95, 0.7, 0.4]  # How strongly conservation applies
+    
+    with figures.subplots(figsize=(10, 6)) as (fig, ax):
+        ax.plot(levels, conservation_strength, 'bo-', linewidth=2, markersize=10)
+        
+        # Add a horizontal line showing perfect conservation
+        ax.axhline(y=1.0, color='r', linestyle='--', alpha=0.7, label='Perfect Conservation')
+        
+        # Add shaded region for "classical domain"
+        ax.axvspan(2, 4, alpha=0.2, color='green', label='Classical Domain')
+        
+        # Set labels
+        ax.set_xlabel('Scale of Physical Phenomena')
+        ax.set_ylabel('Applicability of Energy Conservation')
+        ax.set_title('Energy Conservation Across Scales: An Emergent Pattern')
+        
+        # Rotate x labels for readability
+        ax.tick_params(axis='x', labelrotation=45)
+        
+        # Add legend
+        ax.legend()
+        
+        fig.tight_layout()
+        
+        return figure_png(fig)
+
 def display_metaphysical_arguments_slide():
     """Display the metaphysical arguments slide."""
     display_slide_header(t("metaphysical_title"), 
@@ -575,33 +649,8 @@ def display_metaphysical_arguments_slide():
         - Conflates physical law with metaphysical necessity
     """)
     
-    # Create a chart comparing philosophical conceptions of time
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Data
-    time_models = ['Presentism', 'Growing Block', 'Eternalism', 'Block Universe']
-    implications = [
-        'Only present energy exists',
-        'Past & present energy exist',
-        'Past, present & future energy exist',
-        'Energy exists timelessly'
-    ]
-    compatibility = [0.7, 0.5, 0.3, 0.1]  # Compatibility with energy creation/destruction
-    
-    # Plot
-    ax.barh(time_models, compatibility, color='blue')
-    
-    # Add implications as text
-    for i, imp in enumerate(implications):
-        ax.text(0.02, i, imp, va='center', color='white')
-    
-    # Set labels
-    ax.set_xlabel('Compatibility with Energy Creation/Destruction')
-    ax.set_title('Philosophical Models of Time & Energy Existence')
-    
-    plt.tight_layout()
-    
-    st.pyplot(fig)
+    # Chart comparing philosophical conceptions of time
+    show_figure(_time_models_figure())
     
     st.markdown("""
     ### Substance Metaphysics vs. Process Philosophy
@@ -687,30 +736,5 @@ def display_metaphysical_arguments_slide():
     emerges as a useful principle within certain domains but may not be universally applicable.
     """)
     
-    # Create a visualization of levels of reality and conservation
-    levels = ['Quantum Scale', 'Particle Scale', 'Molecular Scale', 'Human Scale', 'Astronomical Scale', 'Cosmological Scale']
-    conservation_strength = [0.3, 0.7, 0.9, 0.95, 0.7, 0.4]  # How strongly conservation applies
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(levels, conservation_strength, 'bo-', linewidth=2, markersize=10)
-    
-    # Add a horizontal line showing perfect conservation
-    ax.axhline(y=1.0, color='r', linestyle='--', alpha=0.7, label='Perfect Conservation')
-    
-    # Add shaded region for "classical domain"
-    ax.axvspan(2, 4, alpha=0.2, color='green', label='Classical Domain')
-    
-    # Set labels
-    ax.set_xlabel('Scale of Physical Phenomena')
-    ax.set_ylabel('Applicability of Energy Conservation')
-    ax.set_title('Energy Conservation Across Scales: An Emergent Pattern')
-    
-    # Rotate x labels for readability
-    plt.xticks(rotation=45)
-    
-    # Add legend
-    ax.legend()
-    
-    plt.tight_layout()
-    
-    st.pyplot(fig)
+    # Visualization of levels of reality and conservation
+    show_figure(_conservation_scales_figure())
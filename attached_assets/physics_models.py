@@ -1,31 +1,45 @@
+import time
+from functools import lru_cache
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 import plotly.express as px
-from utils import create_equation
+from plotly.subplots import make_subplots
+from utils import create_equation, fragment
+import cosmology
+import drawing
+import ensemble
+import figures
+import hawking
+import tunneling
+from downsampling import (DEFAULT_PLOTLY_WIDTH_PX, bucket_means, downsample, lttb_indices,
+                          minmax_envelope, payload_budget, pixel_budget, plotly_trace)
+import fields
+from fields import gaussian_bumps, random_bump_parameters
+from figure_cache import PNG_SAVEFIG_OPTIONS, cached_figure, figure_png, show_figure
+from plotly_payload import compact_figure
+from instrumentation import instrumented
+from random_streams import DEFAULT_SEED, generator
 
-def virtual_particle_visualization():
-    """Create visualization of quantum vacuum fluctuations."""
+# Figure text in this module is not translated, so every language shares one cached copy
+
+@cached_figure(per_language=False)
+def _virtual_particle_figure(resolution=100, n_pairs=15, seed=DEFAULT_SEED):
+    """Build the quantum vacuum fluctuation surface."""
     # Generate a grid for the field
-    x = np.linspace(0, 10, 100)
-    y = np.linspace(0, 10, 100)
-    X, Y = np.meshgrid(x, y)
-    
-    # Simulate a quantum field with fluctuations
-    np.random.seed(42)  # For reproducibility
-    Z = np.zeros_like(X)
-    
-    # Add multiple particle-antiparticle pairs as Gaussian peaks
-    n_pairs = 15
-    for _ in range(n_pairs):
-        x0, y0 = np.random.uniform(0, 10, 2)
-        sigma = np.random.uniform(0.2, 0.4)
-        amplitude = np.random.uniform(0.5, 1.0)
-        Z += amplitude * np.exp(-((X - x0)**2 + (Y - y0)**2) / (2 * sigma**2))
+    x = np.linspace(0, 10, resolution)
+    y = np.linspace(0, 10, resolution)
+    
+    # Simulate a quantum field with fluctuations, from a generator owned by this render
+    rng = generator(seed)  # For reproducibility
+    
+    # Add multiple particle-antiparticle pairs as Gaussian peaks, all in one batched pass
+    centers, sigmas, amplitudes = random_bump_parameters(rng, n_pairs)
+    Z = gaussian_bumps(x, y, centers, sigmas, amplitudes, dtype=np.float32)
     
     # Create the figure
-    fig = go.Figure(data=[go.Surface(z=Z, x=X, y=Y, 
+    # The surface takes the 1D axes; a meshgrid would send both coordinates per point
+    fig = go.Figure(data=[go.Surface(z=Z, x=x, y=y, 
                                     colorscale='Viridis',
                                     opacity=0.8)])
     
@@ -52,7 +66,90 @@ def virtual_particle_visualization():
         yref="paper"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+# Spectral vacuum fields: grid sizes (FFT-friendly powers of two), spectrum labels
+# and the slide time range over which the field evolves
+RANDOM_FIELD_RESOLUTIONS = (64, 128, 256, 512)
+RANDOM_FIELD_SPECTRA = {
+    "white": "White noise",
+    "power_law": "Power law 1/kⁿ",
+    "band": "Band-limited (1 ≤ k ≤ 4)",
+}
+RANDOM_FIELD_END_TIME = 10.0
+
+# Copies per side the periodic vacuum field can be tiled into
+RANDOM_FIELD_COPIES = (1, 2, 3)
+
+@lru_cache(maxsize=8)
+def _vacuum_modes(resolution, spectrum, index, seed):
+    """Fourier modes of the vacuum field, shared by every frame of its evolution."""
+    modes = fields.spectral_modes(generator(seed), (resolution, resolution), spectrum=spectrum,
+                                  index=index)
+    for array in modes[1:]:
+        array.flags.writeable = False
+    return modes
+
+@cached_figure(per_language=False)
+def _random_field_figure(resolution=128, spectrum="power_law", index=2.0, instant=0.0,
+                         seed=DEFAULT_SEED, copies=1):
+    """Build the vacuum surface as a Gaussian random field at one instant, tiled copies x copies."""
+    Z = fields.field_at(_vacuum_modes(resolution, spectrum, index, seed), instant)
+    x, y, Z = fields.tile(Z, 10.0, copies)
+    
+    fig = go.Figure(data=[go.Surface(z=Z, x=x, y=y, colorscale='Viridis', opacity=0.8)])
+    label = f"Power law 1/k^{index:g}" if spectrum == "power_law" else RANDOM_FIELD_SPECTRA[spectrum]
+    fig.update_layout(
+        title=f'Quantum Vacuum Energy Fluctuations ({label}, t = {instant:g})',
+        scene=dict(
+            xaxis_title='Space',
+            yaxis_title='Space',
+            zaxis_title='Energy Density',
+            camera=dict(eye=dict(x=1.5, y=1.5, z=1.2)),
+        ),
+        width=700,
+        height=500,
+    )
+    fig.add_annotation(
+        x=0.5,
+        y=0.95,
+        text="A periodic Gaussian random field: every wavelength fluctuates at once",
+        showarrow=False,
+        xref="paper",
+        yref="paper"
+    )
+    return fig
+
+@fragment
+@instrumented("visualization")
+def virtual_particle_visualization():
+    """Create visualization of quantum vacuum fluctuations."""
+    generator_choice = st.radio("Field generator", ["Virtual particle pairs", "Gaussian random field"],
+                                horizontal=True, key="vacuum_generator")
+    if generator_choice == "Gaussian random field":
+        col1, col2 = st.columns(2)
+        with col1:
+            spectrum = st.selectbox("Power spectrum", list(RANDOM_FIELD_SPECTRA),
+                                    format_func=RANDOM_FIELD_SPECTRA.get, index=1)
+            index = 2.0
+            if spectrum == "power_law":
+                index = st.slider("Spectral index n", min_value=0.0, max_value=4.0, value=2.0, step=0.5)
+        with col2:
+            resolution = st.select_slider("Grid resolution", options=RANDOM_FIELD_RESOLUTIONS,
+                                          value=128)
+            instant = st.slider("Time", min_value=0.0, max_value=RANDOM_FIELD_END_TIME, value=0.0,
+                                step=0.1)
+            copies = st.select_slider("Periodic copies per side", options=RANDOM_FIELD_COPIES, value=1,
+                                      key="vacuum_copies")
+        show_figure(_random_field_figure(resolution, spectrum, index, instant, copies=copies))
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            resolution = st.slider("Grid resolution", min_value=50, max_value=300,
+                                   value=100, step=25)
+        with col2:
+            n_pairs = st.slider("Virtual particle pairs", min_value=1, max_value=2000, value=15)
+        show_figure(_virtual_particle_figure(resolution, n_pairs))
     
     st.markdown("""
     The visualization above shows energy density fluctuations in the quantum vacuum. 
@@ -63,89 +160,269 @@ def virtual_particle_visualization():
     violation of energy conservation from a classical perspective.
     """)
 
-def spacetime_expansion_visualization():
-    """Create visualization of energy in expanding spacetime."""
+# Expansion histories a(t) come from the Friedmann equation (see cosmology.py). The
+# slides show the stretch in which a grows from 1 to EXPANSION_FINAL_SCALE, rescaled
+# to run from t = 0 to EXPANSION_END_TIME
+EXPANSION_END_TIME = 10.0
+EXPANSION_FINAL_SCALE = 3.0
+DEFAULT_COSMOLOGY = cosmology.PRESETS["lcdm"]
+
+# Session state entry holding the cosmology choice: (preset or "custom", custom Cosmology)
+COSMOLOGY_CHOICE_KEY = "cosmology_choice"
+
+# Side length of the comoving grid in the expanding-space figures
+EXPANSION_GRID_SIZE = 5
+
+# Cosmological parameter sliders, in Cosmology field order: label, min, max, step, format
+COSMOLOGY_SLIDERS = {
+    "omega_m": ("Ω_m (matter)", 0.0, 2.0, 0.005, "%.3f"),
+    "omega_r": ("Ω_r (radiation)", 0.0, 1.0, 0.00001, "%.5f"),
+    "omega_lambda": ("Ω_Λ (dark energy)", 0.0, 2.0, 0.005, "%.3f"),
+    "w": ("w (dark energy equation of state)", -2.0, 0.0, 0.01, "%.2f"),
+}
+
+def _expansion_window(params):
+    """Friedmann solution of params and the cosmic times at which a = 1 and a = EXPANSION_FINAL_SCALE."""
+    a, t, hubble = cosmology.expanding_part(cosmology.solve(params))
+    # A closed universe that turns around first ends the window at maximum expansion
+    start, end = np.interp([1.0, EXPANSION_FINAL_SCALE], a, t, right=t[-1])
+    return a, t, hubble, start, end
+
+def _slide_to_cosmic_time(times, start, end):
+    return start + (np.asarray(times, dtype=float) / EXPANSION_END_TIME) * (end - start)
+
+def scale_factor(times, params=DEFAULT_COSMOLOGY):
+    """Evaluate the scale factor a(t) of a Friedmann universe at slide times 0 .. EXPANSION_END_TIME."""
+    a, t, _, start, end = _expansion_window(params)
+    return np.interp(_slide_to_cosmic_time(times, start, end), t, a)
+
+def hubble_rate(times, params=DEFAULT_COSMOLOGY):
+    """Evaluate H(t) / H0 of a Friedmann universe at slide times 0 .. EXPANSION_END_TIME."""
+    _, t, hubble, start, end = _expansion_window(params)
+    return np.interp(_slide_to_cosmic_time(times, start, end), t, hubble)
+
+def reaches_today(params):
+    """Whether params describe a universe that expands from a Big Bang to today's size."""
+    return bool(np.isfinite(cosmology.age(cosmology.solve(params))))
+
+def cosmology_controls():
+    """Let the viewer pick a preset universe or set Ω_m, Ω_r, Ω_Λ and w; returns a Cosmology.
+
+    Streamlit drops a widget's state in runs that don't draw it, so the choice is
+    also kept under COSMOLOGY_CHOICE_KEY and seeds the widgets on both cosmology
+    slides: moving between them keeps the same universe.
+    """
+    preset, custom = st.session_state.get(COSMOLOGY_CHOICE_KEY, ("lcdm", DEFAULT_COSMOLOGY))
+    options = list(cosmology.PRESETS) + ["custom"]
+    choice = st.selectbox("Universe", options, index=options.index(preset), key="cosmology_preset",
+                          format_func=lambda key: cosmology.PRESET_LABELS.get(key, "Custom parameters"))
+    if choice == "custom":
+        columns = st.columns(len(COSMOLOGY_SLIDERS))
+        custom = cosmology.Cosmology(*(
+            column.slider(label, min_value=low, max_value=high, value=getattr(custom, name),
+                          step=step, format=number_format, key=f"cosmology_{name}")
+            for column, (name, (label, low, high, step, number_format))
+            in zip(columns, COSMOLOGY_SLIDERS.items())
+        ))
+    # Custom parameters are remembered while a preset is shown
+    st.session_state[COSMOLOGY_CHOICE_KEY] = (choice, custom)
+    return custom if choice == "custom" else cosmology.PRESETS[choice]
+
+@cached_figure(per_language=False)
+def _spacetime_expansion_panels_figure(params=DEFAULT_COSMOLOGY):
+    """Build the grid of expanding-space panels, one per time step."""
     # Create data for expanding space
-    times = np.linspace(0, 10, 6)
-    scale_factors = 1 + 0.2 * times
+    times = np.linspace(0, EXPANSION_END_TIME, 6)
+    scale_factors = scale_factor(times, params)
     
     # Set up the figure with subplots for each time
-    fig, axes = plt.subplots(2, 3, figsize=(15, 8))
-    axes = axes.flatten()
-    
-    # Create data for photon wavelength
-    wave_x = np.linspace(0, 2*np.pi, 100)
-    
-    # Track total energy for system
+    with figures.subplots(2, 3, figsize=(15, 8)) as (fig, axes):
+        axes = axes.flatten()
+        
+        # Create data for photon wavelength
+        wave_x = np.linspace(0, 2*np.pi, 100)
+        
+        initial_energy = 1.0
+        
+        # Plot each time step
+        for i, (t, a) in enumerate(zip(times, scale_factors)):
+            if i < len(axes):
+                # Plot the expanding grid (representing spacetime)
+                grid_size = EXPANSION_GRID_SIZE
+                x_grid = np.linspace(0, grid_size, 6) * a
+                y_grid = np.linspace(0, grid_size, 6) * a
+                
+                # Plot the grid, as two artists rather than one per line
+                drawing.grid_lines(axes[i], x_grid, y_grid, color='gray', alpha=0.5, linestyle=':')
+                
+                # Plot a photon (shown as a wave)
+                wave_amplitude = 0.5 / np.sqrt(a)  # Amplitude decreases with expansion
+                wavelength = a  # Wavelength increases with expansion
+                wave_y = wave_amplitude * np.sin(wave_x / wavelength * 2*np.pi) + grid_size/2
+                
+                axes[i].plot(wave_x * a, wave_y, 'r-', linewidth=2)
+                
+                # Calculate photon energy (E ∝ 1/λ)
+                photon_energy = initial_energy/a  # Energy decreases as wavelength increases
+                
+                # Add an arrow showing the "lost" energy
+                if i > 0:
+                    axes[i].arrow(grid_size*a*0.8, grid_size*a*0.8, 0, -0.5*a, 
+                                 head_width=0.2*a, head_length=0.1*a, fc='blue', ec='blue')
+                    axes[i].text(grid_size*a*0.8 + 0.1*a, grid_size*a*0.7, 
+                                f'Energy "lost"\n{initial_energy - photon_energy:.2f}', 
+                                color='blue')
+                
+                # Add time-dependent Lagrangian to illustrate breaking of time invariance
+                lagrangian_text = f'$\\mathcal{{L}}(t) = \\mathcal{{L}}(q,\\dot{{q}},a(t))$'
+                axes[i].text(grid_size*a*0.2, grid_size*a*0.1, lagrangian_text, fontsize=10)
+                axes[i].text(grid_size*a*0.2, grid_size*a*0.2, f'Time symmetry broken\nby a(t) = {a:.2f}', fontsize=8)
+                
+                axes[i].set_title(f'Time: {t:.1f}, Scale: {a:.1f}, Photon Energy: {photon_energy:.2f}')
+                axes[i].set_xlim(0, grid_size * a)
+                axes[i].set_ylim(0, grid_size * a)
+                axes[i].set_aspect('equal')
+        
+        fig.tight_layout()
+        
+        # Add a collective title
+        fig.suptitle('Photon Energy Loss in Expanding Space: Breaking Time Invariance', fontsize=16, y=1.02)
+        
+        return figure_png(fig)
+
+@cached_figure(per_language=False)
+def _spacetime_expansion_energy_figure(params=DEFAULT_COSMOLOGY):
+    """Build the photon energy decline chart, with the expansion rate H(t) behind it."""
+    times = np.linspace(0, EXPANSION_END_TIME, 6)
+    scale_factors = scale_factor(times, params)
     initial_energy = 1.0
-    total_energies = []
-    
-    # Plot each time step
-    for i, (t, a) in enumerate(zip(times, scale_factors)):
-        if i < len(axes):
-            # Plot the expanding grid (representing spacetime)
-            grid_size = 5
-            x_grid = np.linspace(0, grid_size, 6) * a
-            y_grid = np.linspace(0, grid_size, 6) * a
-            
-            # Plot the grid
-            for x in x_grid:
-                axes[i].axvline(x, color='gray', alpha=0.5, linestyle=':')
-            for y in y_grid:
-                axes[i].axhline(y, color='gray', alpha=0.5, linestyle=':')
-            
-            # Plot a photon (shown as a wave)
-            wave_amplitude = 0.5 / np.sqrt(a)  # Amplitude decreases with expansion
-            wavelength = a  # Wavelength increases with expansion
-            wave_y = wave_amplitude * np.sin(wave_x / wavelength * 2*np.pi) + grid_size/2
-            
-            axes[i].plot(wave_x * a, wave_y, 'r-', linewidth=2)
-            
-            # Calculate photon energy (E ∝ 1/λ)
-            photon_energy = initial_energy/a  # Energy decreases as wavelength increases
-            
-            # Add an arrow showing the "lost" energy
-            if i > 0:
-                axes[i].arrow(grid_size*a*0.8, grid_size*a*0.8, 0, -0.5*a, 
-                             head_width=0.2*a, head_length=0.1*a, fc='blue', ec='blue')
-                axes[i].text(grid_size*a*0.8 + 0.1*a, grid_size*a*0.7, 
-                            f'Energy "lost"\n{initial_energy - photon_energy:.2f}', 
-                            color='blue')
-            
-            # Track total system energy
-            total_energies.append(photon_energy)
-            
-            # Add time-dependent Lagrangian to illustrate breaking of time invariance
-            lagrangian_text = f'$\\mathcal{{L}}(t) = \\mathcal{{L}}(q,\\dot{{q}},a(t))$'
-            axes[i].text(grid_size*a*0.2, grid_size*a*0.1, lagrangian_text, fontsize=10)
-            axes[i].text(grid_size*a*0.2, grid_size*a*0.2, f'Time symmetry broken\nby a(t) = {a:.2f}', fontsize=8)
-            
-            axes[i].set_title(f'Time: {t:.1f}, Scale: {a:.1f}, Photon Energy: {photon_energy:.2f}')
-            axes[i].set_xlim(0, grid_size * a)
-            axes[i].set_ylim(0, grid_size * a)
-            axes[i].set_aspect('equal')
-    
-    plt.tight_layout()
-    
-    # Add a collective title
-    fig.suptitle('Photon Energy Loss in Expanding Space: Breaking Time Invariance', fontsize=16, y=1.02)
-    
-    st.pyplot(fig)
+    total_energies = initial_energy / scale_factors
     
     # Create additional graph showing energy decline over time
-    fig2, ax2 = plt.subplots(figsize=(10, 5))
-    ax2.plot(times, total_energies, 'bo-', linewidth=2, markersize=8)
-    ax2.set_xlabel('Time')
-    ax2.set_ylabel('Photon Energy')
-    ax2.set_title('Photon Energy Decreases as Universe Expands')
-    ax2.grid(True, alpha=0.3)
-    
-    # Add annotation explaining why energy conservation fails
-    ax2.annotate('Energy conservation fails because\nexpanding space breaks time invariance', 
-                xy=(5, total_energies[3]), xytext=(3, total_energies[0]*0.8),
-                arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8))
+    with figures.subplots(figsize=(10, 5)) as (fig2, ax2):
+        ax2.plot(times, total_energies, 'bo-', linewidth=2, markersize=8)
+        ax2.set_xlabel('Time')
+        ax2.set_ylabel('Photon Energy')
+        ax2.set_title('Photon Energy Decreases as Universe Expands')
+        ax2.grid(True, alpha=0.3)
+        
+        # Add annotation explaining why energy conservation fails
+        ax2.annotate('Energy conservation fails because\nexpanding space breaks time invariance', 
+                    xy=(5, total_energies[3]), xytext=(3, total_energies[0]*0.8),
+                    arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8))
+        
+        # Expansion rate of the same Friedmann solution on a second axis
+        dense_times = np.linspace(0, EXPANSION_END_TIME, 100)
+        rate_axis = ax2.twinx()
+        rate_axis.plot(dense_times, hubble_rate(dense_times, params), color='tab:green',
+                       linestyle='--', label='H(t) / H₀')
+        rate_axis.set_ylabel('Expansion rate H(t) / H₀', color='tab:green')
+        rate_axis.set_ylim(bottom=0)
+        rate_axis.legend(loc='upper right')
+        
+        return figure_png(fig2)
+
+@cached_figure(per_language=False)
+def _spacetime_expansion_animation(n_frames=200, params=DEFAULT_COSMOLOGY):
+    """Build a Plotly animation of expanding space, with every frame precomputed."""
+    grid_size = EXPANSION_GRID_SIZE
+    times = np.linspace(0, EXPANSION_END_TIME, n_frames)
+    a = scale_factor(times, params)
+    energies = 1.0 / a  # Photon energy E ∝ 1/λ ∝ 1/a
+    
+    # Expanding grid for all frames at once: 6 vertical and 6 horizontal lines per
+    # frame, drawn as one trace with NaN gaps between the segments
+    ticks = np.linspace(0, grid_size, 6)[None, :] * a[:, None]
+    zeros = np.zeros_like(ticks)
+    spans = np.broadcast_to(grid_size * a[:, None], ticks.shape)
+    gaps = np.full_like(ticks, np.nan)
+    across = np.stack([ticks, ticks, gaps], axis=-1)
+    along = np.stack([zeros, spans, gaps], axis=-1)
+    grid_x = np.concatenate([across, along], axis=1).reshape(n_frames, -1).astype(np.float32)
+    grid_y = np.concatenate([along, across], axis=1).reshape(n_frames, -1).astype(np.float32)
+    
+    # Photon wave for all frames: wavelength grows with a, amplitude falls as 1/sqrt(a)
+    wave_x = np.linspace(0, 2*np.pi, 100)
+    photon_x = (wave_x[None, :] * a[:, None]).astype(np.float32)
+    photon_y = (0.5 / np.sqrt(a[:, None]) * np.sin(wave_x[None, :] / a[:, None] * 2*np.pi)
+                + grid_size/2).astype(np.float32)
+    
+    labels = [f"t = {t:.2f}, a(t) = {scale:.2f}<br>Photon energy {energy:.2f} "
+              f"(\"lost\" {1 - energy:.2f})"
+              for t, scale, energy in zip(times, a, energies)]
+    label_x, label_y = 0.05 * grid_size * a[-1], 0.95 * grid_size * a[-1]
+    
+    fig = make_subplots(rows=1, cols=2, column_widths=[0.6, 0.4],
+                        subplot_titles=("Expanding space", "Photon energy"))
+    fig.add_trace(go.Scatter(x=grid_x[0], y=grid_y[0], mode="lines",
+                             line=dict(color="gray", width=1, dash="dot"),
+                             name="Comoving grid", hoverinfo="skip"), row=1, col=1)
+    fig.add_trace(go.Scatter(x=photon_x[0], y=photon_y[0], mode="lines",
+                             line=dict(color="red", width=2), name="Photon"), row=1, col=1)
+    fig.add_trace(go.Scatter(x=[label_x], y=[label_y], text=[labels[0]], mode="text",
+                             textposition="bottom right", showlegend=False, hoverinfo="skip"),
+                  row=1, col=1)
+    fig.add_trace(go.Scatter(x=times, y=energies, mode="lines", line=dict(color="blue", width=2),
+                             name="E(t) = E₀ / a(t)"), row=1, col=2)
+    fig.add_trace(go.Scatter(x=times[:1], y=energies[:1], mode="markers",
+                             marker=dict(color="blue", size=12), showlegend=False), row=1, col=2)
+    
+    # Frames only carry what changes (traces 0-2 and 4; the energy curve is static).
+    # Plain dicts, assigned in one go, are validated much faster than go.Frame objects
+    fig.frames = [
+        dict(name=str(i), traces=[0, 1, 2, 4], data=[
+            dict(type="scatter", x=grid_x[i], y=grid_y[i]),
+            dict(type="scatter", x=photon_x[i], y=photon_y[i]),
+            dict(type="scatter", text=[labels[i]]),
+            dict(type="scatter", x=times[i:i + 1], y=energies[i:i + 1]),
+        ])
+        for i in range(n_frames)
+    ]
+    
+    # Playback runs entirely in the browser: about eight seconds whatever the frame count
+    frame_ms = max(16, 8000 // n_frames)
+    play = {"frame": {"duration": frame_ms, "redraw": False}, "fromcurrent": True,
+            "transition": {"duration": 0}, "mode": "immediate"}
+    jump = {"frame": {"duration": 0, "redraw": False}, "transition": {"duration": 0},
+            "mode": "immediate"}
+    fig.update_layout(
+        title=f"Photon Energy Loss in Expanding Space ({cosmology.describe(params)})",
+        height=550,
+        updatemenus=[dict(type="buttons", direction="left", x=0, y=-0.12,
+                          xanchor="left", yanchor="top", buttons=[
+            dict(label="Play", method="animate", args=[None, play]),
+            dict(label="Pause", method="animate", args=[[None], jump]),
+        ])],
+        sliders=[dict(x=0.12, y=-0.08, len=0.88, currentvalue=dict(prefix="Frame "), steps=[
+            dict(label=str(i), method="animate", args=[[str(i)], jump]) for i in range(n_frames)
+        ])],
+    )
+    extent = grid_size * a[-1]
+    fig.update_xaxes(range=[0, extent], title_text="Physical distance", row=1, col=1)
+    fig.update_yaxes(range=[0, extent], scaleanchor="x", scaleratio=1, row=1, col=1)
+    fig.update_xaxes(title_text="Time", row=1, col=2)
+    fig.update_yaxes(range=[0, 1.05], title_text="Photon energy (E₀ = 1)", row=1, col=2)
     
-    st.pyplot(fig2)
+    return fig
+
+@fragment
+@instrumented("visualization")
+def spacetime_expansion_visualization():
+    """Create visualization of energy in expanding spacetime."""
+    mode = st.radio("Display", ["Static panels", "Animation"], horizontal=True,
+                    key="spacetime_display")
+    params = cosmology_controls()
+    if not reaches_today(params):
+        st.warning("These parameters give a universe without a Big Bang, or one that recollapses "
+                   "before reaching today's size. Showing ΛCDM instead.")
+        params = DEFAULT_COSMOLOGY
+    
+    if mode == "Animation":
+        n_frames = st.slider("Animation frames", min_value=10, max_value=1000, value=200, step=10)
+        show_figure(_spacetime_expansion_animation(n_frames, params))
+    else:
+        show_figure(_spacetime_expansion_panels_figure(params))
+    show_figure(_spacetime_expansion_energy_figure(params))
     
     st.markdown("""
     This visualization demonstrates why energy is not conserved as space expands:
@@ -174,63 +451,195 @@ def spacetime_expansion_visualization():
     as the total energy of the universe demonstrably increases over time with no identifiable source.
     """)
 
-def quantum_fluctuation_visualization():
-    """Create visualization of energy fluctuations from uncertainty principle."""
+# Samples behind the fluctuation and dark energy charts; both are downsampled to the
+# chart's pixel width before drawing
+FLUCTUATION_SAMPLES = 1_000_000
+DARK_ENERGY_SAMPLES = 1_000_000
+
+# Constant classical energy of the fluctuation chart, and ħ in its units
+CLASSICAL_ENERGY = 5.0
+FLUCTUATION_HBAR = 1.0
+
+# Ensemble mode: realizations and time samples the sliders offer, and how often the
+# partial bands are redrawn while a new ensemble streams in
+ENSEMBLE_SIZES = (100, 1_000, 10_000, 100_000)
+ENSEMBLE_TIME_SAMPLES = (1_000, 10_000)
+ENSEMBLE_REFRESH_SECONDS = 1.0
+
+def fluctuation_scale(t):
+    """Standard deviation of the energy fluctuations after observing for a time t."""
+    # Short timescale = large fluctuations
+    return 1 / (0.1 + t/5)  # Decreases with time (longer observation)
+
+@cached_figure(per_language=False)
+def _quantum_fluctuation_figure(seed=DEFAULT_SEED, n_samples=FLUCTUATION_SAMPLES):
+    """Build the energy fluctuation chart."""
     # Generate time values
-    t = np.linspace(0, 10, 1000)
+    t = np.linspace(0, 10, n_samples)
     
     # Set up the figure
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Create energy values with fluctuations
-    np.random.seed(42)  # For reproducibility
-    
-    # Plot classical constant energy
-    classical_energy = np.ones_like(t) * 5
-    
-    # Create quantum fluctuations with varying time-energy uncertainty
-    # Short timescale = large fluctuations
-    fluctuation_scale = 1 / (0.1 + t/5)  # Decreases with time (longer observation)
-    quantum_energy = classical_energy + np.random.normal(0, fluctuation_scale, size=len(t))
-    
-    # Draw uncertainty bands
-    uncertainty = fluctuation_scale * 2
-    
-    # Plot
-    ax.plot(t, classical_energy, 'k--', label='Classical Energy (Constant)')
-    ax.plot(t, quantum_energy, 'b-', label='Quantum Energy (with fluctuations)')
-    ax.fill_between(t, classical_energy - uncertainty, classical_energy + uncertainty, 
-                   color='blue', alpha=0.2, label='Uncertainty Range (ΔE)')
-    
-    # Add annotations
-    ax.annotate('Short timescale:\nLarge energy uncertainty',
-              xy=(0.5, 7), xytext=(0.5, 8.5),
-              arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8))
-    
-    ax.annotate('Long timescale:\nSmaller energy uncertainty',
-              xy=(9, 5.5), xytext=(7, 7),
-              arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8))
-    
-    # Set plot properties
-    ax.set_xlabel('Time (Observation Duration)')
-    ax.set_ylabel('Energy')
-    ax.set_title('Energy Fluctuations and the Uncertainty Principle')
-    ax.legend(loc='upper right')
-    ax.grid(True, alpha=0.3)
-    ax.set_ylim(0, 10)
-    
-    # Add the uncertainty relation as text
-    ax.text(5, 1, r'$\Delta E \cdot \Delta t \geq \frac{\hbar}{2}$', 
-           bbox=dict(facecolor='white', alpha=0.8), fontsize=14, ha='center')
-    
-    st.pyplot(fig)
+    with figures.subplots(figsize=(10, 6)) as (fig, ax):
+        # Create energy values with fluctuations
+        rng = generator(seed)  # For reproducibility
+        
+        # Plot classical constant energy
+        classical_energy = np.ones_like(t) * CLASSICAL_ENERGY
+        
+        # Create quantum fluctuations with varying time-energy uncertainty
+        scale = fluctuation_scale(t)
+        quantum_energy = classical_energy + rng.normal(0, scale, size=len(t))
+        
+        # Draw uncertainty bands
+        uncertainty = scale * 2
+        
+        # Reduce to the pixel width: the extremes of the noise in every pixel column,
+        # which keeps each peak, and the shape of the band
+        width_px = fig.get_figwidth() * PNG_SAVEFIG_OPTIONS["dpi"]
+        noise_t, noise_low, noise_high = minmax_envelope(t, quantum_energy, int(width_px))
+        band_t, band = downsample(t, uncertainty, pixel_budget(width_px, "lttb"))
+        
+        # Plot
+        ax.plot(t[[0, -1]], classical_energy[[0, -1]], 'k--', label='Classical Energy (Constant)',
+                zorder=3)
+        ax.fill_between(noise_t, noise_low, noise_high, color='tab:blue', alpha=0.35, linewidth=0,
+                        label='Quantum Energy (with fluctuations)')
+        ax.fill_between(band_t, 5 - band, 5 + band, 
+                       color='blue', alpha=0.2, label='Uncertainty Range (ΔE)')
+        
+        # Add annotations
+        ax.annotate('Short timescale:\nLarge energy uncertainty',
+                  xy=(0.5, 7), xytext=(0.5, 8.5),
+                  arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8))
+        
+        ax.annotate('Long timescale:\nSmaller energy uncertainty',
+                  xy=(9, 5.5), xytext=(7, 7),
+                  arrowprops=dict(facecolor='black', shrink=0.05, width=1.5, headwidth=8))
+        
+        # Set plot properties
+        ax.set_xlabel('Time (Observation Duration)')
+        ax.set_ylabel('Energy')
+        ax.set_title('Energy Fluctuations and the Uncertainty Principle')
+        ax.legend(loc='upper right')
+        ax.grid(True, alpha=0.3)
+        ax.set_ylim(0, 10)
+        
+        # Add the uncertainty relation as text
+        ax.text(5, 1, r'$\Delta E \cdot \Delta t \geq \frac{\hbar}{2}$', 
+               bbox=dict(facecolor='white', alpha=0.8), fontsize=14, ha='center')
+        
+        return figure_png(fig)
+
+def _fluctuation_ensemble_chart(times, summary, check, total):
+    """Build the ensemble chart: percentile bands, and ΔE·Δt against the ħ/2 bound."""
+    # The bands are smooth, so one LTTB selection on the median serves every trace
+    keep = lttb_indices(times, summary.bands[50], pixel_budget(DEFAULT_PLOTLY_WIDTH_PX))
+    x = times[keep].astype(np.float32)
+    bands = {percent: band[keep].astype(np.float32) for percent, band in summary.bands.items()}
+    
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.65, 0.35],
+                        vertical_spacing=0.06)
+    for low, high, alpha in ((5, 95, 0.15), (25, 75, 0.35)):
+        fig.add_trace(go.Scatter(x=x, y=bands[low], mode='lines', line=dict(width=0),
+                                 showlegend=False, hoverinfo='skip'), row=1, col=1)
+        fig.add_trace(go.Scatter(x=x, y=bands[high], mode='lines', line=dict(width=0),
+                                 fill='tonexty', fillcolor=f'rgba(0, 0, 255, {alpha})',
+                                 name=f'{low}th-{high}th percentile'), row=1, col=1)
+    fig.add_trace(go.Scatter(x=x, y=bands[50], mode='lines', line=dict(color='blue'),
+                             name='Median energy'), row=1, col=1)
+    fig.add_trace(go.Scatter(x=x[[0, -1]], y=[CLASSICAL_ENERGY] * 2, mode='lines',
+                             line=dict(color='black', dash='dash'),
+                             name='Classical Energy (Constant)'), row=1, col=1)
+    
+    fig.add_trace(go.Scatter(x=x, y=check.product[keep].astype(np.float32), mode='lines',
+                             line=dict(color='green'), name='Empirical ΔE·Δt'), row=2, col=1)
+    fig.add_hline(y=FLUCTUATION_HBAR / 2, line=dict(color='red', dash='dot'),
+                  annotation_text='ħ/2', row=2, col=1)
+    if check.fraction < 1:
+        end = check.holds_from if np.isfinite(check.holds_from) else times[-1]
+        fig.add_vrect(x0=times[0], x1=end, fillcolor='red', opacity=0.1, line_width=0,
+                      row=2, col=1)
+    
+    streamed = f" ({summary.count / total:.0%} streamed)" if summary.count < total else ""
+    fig.update_layout(
+        title=(f'Energy Fluctuations over {summary.count:,} Realizations{streamed}'
+               f'<br><sup>ΔE·Δt ≥ ħ/2 (ħ = {FLUCTUATION_HBAR:g}) holds at '
+               f'{check.fraction:.1%} of instants, for every Δt ≥ {check.holds_from:.3g}</sup>'),
+        height=650,
+    )
+    fig.update_yaxes(title_text='Energy', row=1, col=1)
+    fig.update_yaxes(title_text='ΔE·Δt', rangemode='tozero', row=2, col=1)
+    fig.update_xaxes(title_text='Time (Observation Duration)', row=2, col=1)
+    return fig
+
+def _fluctuation_ensemble_times(n_times):
+    return np.linspace(0, 10, n_times)
+
+@cached_figure(per_language=False)
+def _fluctuation_ensemble_figure(seed=DEFAULT_SEED, n_realizations=1_000, n_times=1_000):
+    """Build the ensemble chart from n_realizations noisy series of n_times samples."""
+    times = _fluctuation_ensemble_times(n_times)
+    stats = ensemble.run(n_realizations, CLASSICAL_ENERGY, fluctuation_scale(times), seed)
+    summary = ensemble.summarize(stats)
+    check = ensemble.bound_check(times, summary.std, summary.count, FLUCTUATION_HBAR)
+    return _fluctuation_ensemble_chart(times, summary, check, n_realizations)
+
+def _streamed_fluctuation_ensemble(seed, n_realizations, n_times):
+    """The ensemble chart; while a new ensemble runs, show its progress and partial bands."""
+    times = _fluctuation_ensemble_times(n_times)
+    progress_bar, preview = None, None
+    last_draw = time.perf_counter()
+    
+    def report(done, total, stats):
+        nonlocal progress_bar, preview, last_draw
+        if progress_bar is None:
+            progress_bar, preview = st.progress(0.0), st.empty()
+        progress_bar.progress(done / total, text=f"{done:,} of {total:,} realizations")
+        if done < total and time.perf_counter() - last_draw >= ENSEMBLE_REFRESH_SECONDS:
+            summary = ensemble.summarize(stats)
+            check = ensemble.bound_check(times, summary.std, summary.count, FLUCTUATION_HBAR)
+            partial = _fluctuation_ensemble_chart(times, summary, check, total)
+            preview.plotly_chart(compact_figure(partial), use_container_width=True)
+            last_draw = time.perf_counter()
+    
+    token = ensemble.progress_callback.set(report)
+    try:
+        figure = _fluctuation_ensemble_figure(seed, n_realizations, n_times)
+    finally:
+        ensemble.progress_callback.reset(token)
+    if progress_bar is not None:
+        progress_bar.empty()
+        preview.empty()
+    return figure
+
+@fragment
+@instrumented("visualization")
+def quantum_fluctuation_visualization():
+    """Create visualization of energy fluctuations from uncertainty principle."""
+    mode = st.radio("Realizations", ["Single", "Ensemble"], horizontal=True,
+                    key="fluctuation_realizations")
+    if mode == "Ensemble":
+        col1, col2 = st.columns(2)
+        with col1:
+            n_realizations = st.select_slider("Number of realizations", options=ENSEMBLE_SIZES,
+                                              value=1_000)
+        with col2:
+            n_times = st.select_slider("Time samples per realization",
+                                       options=ENSEMBLE_TIME_SAMPLES, value=1_000)
+        show_figure(_streamed_fluctuation_ensemble(DEFAULT_SEED, n_realizations, n_times))
+    else:
+        show_figure(_quantum_fluctuation_figure())
     
     st.markdown("""
     This visualization demonstrates the energy-time uncertainty relation:
     
     1. The dashed line represents classical constant energy
-    2. The blue line shows quantum energy with fluctuations
-    3. The blue shaded region represents the uncertainty in energy (ΔE)
+    2. The darker blue band is the envelope of the quantum energy: the lowest and highest
+       fluctuation at each moment
+    3. The lighter blue shaded region represents the uncertainty in energy (ΔE)
+    
+    In ensemble mode the chart shows many independent realizations at once: percentile
+    bands of the energy at every instant, and the spread ΔE measured across the ensemble
+    multiplied by Δt, checked against the ħ/2 bound.
     
     Key observations:
     - At short timescales (small Δt), energy fluctuations can be large
@@ -241,55 +650,142 @@ def quantum_fluctuation_visualization():
     violate classical energy conservation.
     """)
 
-def dark_energy_visualization():
-    """Create visualization of dark energy and its challenge to conservation."""
-    # Create data for different types of energy density evolution
-    a_values = np.linspace(0.1, 2, 100)  # Scale factor (1 = present day)
-    
-    # Different types of energy density evolution with scale factor
-    matter_density = 1/a_values**3  # Matter: ρ ∝ a^-3
-    radiation_density = 1/a_values**4  # Radiation: ρ ∝ a^-4
-    dark_energy_density = np.ones_like(a_values)  # Dark energy: ρ = constant
-    
-    # Total energy in a comoving volume (scale with a^3)
-    matter_energy = matter_density * a_values**3  # Constant (conserved)
-    radiation_energy = radiation_density * a_values**3  # Decreases as a^-1
-    dark_energy = dark_energy_density * a_values**3  # Increases as a^3
+# Tunneling sliders: barrier height relative to the packet's energy, and width (ħ = m = 1)
+TUNNELING_BARRIER_RATIOS = (0.5, 2.0, 0.05)
+TUNNELING_BARRIER_WIDTHS = (0.25, 4.0, 0.25)
+
+@cached_figure(per_language=False)
+def _tunneling_animation(barrier_ratio=1.25, barrier_width=1.0):
+    """Build a Plotly animation of a wave packet tunneling through a barrier."""
+    setup = tunneling.Setup(barrier_ratio=barrier_ratio, barrier_width=barrier_width)
+    evolution = tunneling.evolve(setup)
+    times = evolution.times
+    n_frames = len(times)
+    
+    # Every frame averaged down to the chart width; only the density changes per frame
+    x, density = bucket_means(evolution.x, evolution.density, DEFAULT_PLOTLY_WIDTH_PX)
+    x, density = x.astype(np.float32), density.astype(np.float32)
+    peak = float(density.max())
+    height = barrier_ratio * setup.energy
+    
+    fig = make_subplots(rows=2, cols=1, row_heights=[0.6, 0.4], vertical_spacing=0.12,
+                        specs=[[{}], [{"secondary_y": True}]],
+                        subplot_titles=("Probability density |ψ(x, t)|²",
+                                        "Transmission, reflection and energy"))
+    fig.add_trace(go.Scatter(x=x, y=density[0], mode='lines', line=dict(color='blue', width=2),
+                             fill='tozeroy', name='Quantum wave packet'), row=1, col=1)
+    fig.add_trace(go.Scatter(x=times, y=evolution.transmission, mode='lines',
+                             line=dict(color='green'), name='Transmitted probability'),
+                  row=2, col=1)
+    fig.add_trace(go.Scatter(x=times, y=evolution.reflection, mode='lines',
+                             line=dict(color='red'), name='Reflected probability'), row=2, col=1)
+    fig.add_trace(go.Scatter(x=times, y=evolution.energy, mode='lines',
+                             line=dict(color='black', dash='dot'), name='Energy ⟨H⟩'),
+                  row=2, col=1, secondary_y=True)
+    fig.add_trace(go.Scatter(x=times[:1], y=evolution.transmission[:1], mode='markers',
+                             marker=dict(color='green', size=10), showlegend=False), row=2, col=1)
+    fig.add_vrect(x0=-barrier_width / 2, x1=barrier_width / 2, fillcolor='gray', opacity=0.3,
+                  line_width=0, annotation_text=f'Barrier V₀ = {barrier_ratio:g} E',
+                  annotation_position='top', row=1, col=1)
+    
+    fig.frames = [
+        dict(name=str(i), traces=[0, 4], data=[
+            dict(type="scatter", y=density[i]),
+            dict(type="scatter", x=times[i:i + 1], y=evolution.transmission[i:i + 1]),
+        ])
+        for i in range(n_frames)
+    ]
+    
+    play = {"frame": {"duration": 60, "redraw": False}, "fromcurrent": True,
+            "transition": {"duration": 0}, "mode": "immediate"}
+    jump = {"frame": {"duration": 0, "redraw": False}, "transition": {"duration": 0},
+            "mode": "immediate"}
+    drift = np.ptp(evolution.energy) / abs(evolution.energy[0])
+    fig.update_layout(
+        title=(f'Quantum Tunneling Through an Energy Barrier: {evolution.transmission[-1]:.1%} '
+               f'transmitted, {evolution.reflection[-1]:.1%} reflected'
+               f'<br><sup>Crank-Nicolson on {len(evolution.x):,} points; ⟨H⟩ = '
+               f'{evolution.energy[0]:.4f} throughout (relative drift {drift:.0e})</sup>'),
+        height=700,
+        updatemenus=[dict(type="buttons", direction="left", x=0, y=-0.08,
+                          xanchor="left", yanchor="top", buttons=[
+            dict(label="Play", method="animate", args=[None, play]),
+            dict(label="Pause", method="animate", args=[[None], jump]),
+        ])],
+        sliders=[dict(x=0.12, y=-0.04, len=0.88, currentvalue=dict(prefix="t = "), steps=[
+            dict(label=f"{t:.1f}", method="animate", args=[[str(i)], jump])
+            for i, t in enumerate(times)
+        ])],
+    )
+    fig.update_xaxes(title_text='Position x', range=[-60, 60], row=1, col=1)
+    fig.update_yaxes(range=[0, 1.1 * peak], row=1, col=1)
+    fig.update_xaxes(title_text='Time', row=2, col=1)
+    fig.update_yaxes(title_text='Probability', range=[0, 1.05], row=2, col=1)
+    fig.update_yaxes(title_text='⟨H⟩', range=[0, 1.5 * max(height, evolution.energy[0])],
+                     row=2, col=1, secondary_y=True)
+    return fig
+
+@fragment
+@instrumented("visualization")
+def tunneling_visualization():
+    """Create an animated, solved quantum tunneling visualization."""
+    col1, col2 = st.columns(2)
+    with col1:
+        low, high, step = TUNNELING_BARRIER_RATIOS
+        barrier_ratio = st.slider("Barrier height / packet energy", min_value=low, max_value=high,
+                                  value=1.25, step=step)
+    with col2:
+        low, high, step = TUNNELING_BARRIER_WIDTHS
+        barrier_width = st.slider("Barrier width", min_value=low, max_value=high, value=1.0,
+                                  step=step)
+    show_figure(_tunneling_animation(round(barrier_ratio, 2), round(barrier_width, 2)))
+
+# Components of the dark energy chart: key in cosmology.densities, density
+# parameter, density and energy trace names, colour
+DARK_ENERGY_COMPONENTS = (
+    ("matter", "omega_m", "Matter Density", "Matter Energy", "blue"),
+    ("radiation", "omega_r", "Radiation Density", "Radiation Energy", "red"),
+    ("dark_energy", "omega_lambda", "Dark Energy Density", "Dark Energy", "purple"),
+)
+
+@cached_figure(per_language=False)
+def _dark_energy_figure(params=DEFAULT_COSMOLOGY, n_samples=DARK_ENERGY_SAMPLES):
+    """Build the energy density and total energy chart."""
+    # Sampled geometrically so the steep early-universe end is resolved on the log axis
+    a_values = np.geomspace(0.1, 2, n_samples)  # Scale factor (1 = present day)
+    
+    # Densities relative to today's critical density, and the energy they hold in a
+    # comoving volume (density times a^3)
+    densities = cosmology.densities(a_values, params)
+    energies = cosmology.comoving_energies(a_values, params)
+    trends = {
+        "matter": "conserved",
+        "radiation": "decreases",
+        "dark_energy": "increases" if params.w < 0 else "conserved",
+    }
     
     # Create the figure
     fig = go.Figure()
     
-    # Add traces for energy density
-    fig.add_trace(go.Scatter(x=a_values, y=matter_density, 
-                            mode='lines', name='Matter Density',
-                            line=dict(color='blue', dash='dash')))
-    
-    fig.add_trace(go.Scatter(x=a_values, y=radiation_density, 
-                            mode='lines', name='Radiation Density',
-                            line=dict(color='red', dash='dash')))
-    
-    fig.add_trace(go.Scatter(x=a_values, y=dark_energy_density, 
-                            mode='lines', name='Dark Energy Density',
-                            line=dict(color='purple', dash='dash')))
+    # Every trace is downsampled to the chart width, within the payload budget
+    max_points = min(pixel_budget(DEFAULT_PLOTLY_WIDTH_PX), payload_budget(6))
     
-    # Add traces for total energy
-    fig.add_trace(go.Scatter(x=a_values, y=matter_energy, 
-                            mode='lines', name='Matter Energy (conserved)',
-                            line=dict(color='blue')))
-    
-    fig.add_trace(go.Scatter(x=a_values, y=radiation_energy, 
-                            mode='lines', name='Radiation Energy (decreases)',
-                            line=dict(color='red')))
-    
-    fig.add_trace(go.Scatter(x=a_values, y=dark_energy, 
-                            mode='lines', name='Dark Energy (increases)',
-                            line=dict(color='purple')))
+    for key, omega, density_name, energy_name, color in DARK_ENERGY_COMPONENTS:
+        if getattr(params, omega) <= 0:
+            continue  # Absent from this universe, and nothing to draw on a log axis
+        fig.add_trace(plotly_trace(a_values, densities[key], max_points, log_y=True,
+                                   mode='lines', name=density_name,
+                                   line=dict(color=color, dash='dash')))
+        fig.add_trace(plotly_trace(a_values, energies[key], max_points, log_y=True,
+                                   mode='lines', name=f'{energy_name} ({trends[key]})',
+                                   line=dict(color=color)))
     
     # Add layout
     fig.update_layout(
-        title='Energy Density and Total Energy vs. Universe Scale Factor',
+        title=('Energy Density and Total Energy vs. Universe Scale Factor'
+               f'<br><sup>{cosmology.describe(params)}</sup>'),
         xaxis_title='Scale Factor a (1 = present day)',
-        yaxis_title='Relative Value',
+        yaxis_title='Relative to Present Critical Density',
         yaxis_type='log',
         legend=dict(
             x=0.01,
@@ -302,26 +798,91 @@ def dark_energy_visualization():
     # Add vertical line for present day
     fig.add_shape(
         type='line',
-        x0=1, y0=0.1, x1=1, y1=100,
+        x0=1, y0=0, x1=1, y1=1, yref='paper',
         line=dict(color='black', width=1, dash='dot')
     )
     fig.add_annotation(
-        x=1, y=0.15,
+        x=1, y=0.02, yref='paper',
         text='Present Day',
         showarrow=False
     )
     
-    # Add annotation for dark energy challenge
-    fig.add_annotation(
-        x=1.5, y=5,
-        text="Dark energy increases with space expansion,<br>challenging energy conservation",
-        showarrow=True,
-        arrowhead=1,
-        ax=40,
-        ay=-40
-    )
+    # Add annotation for dark energy challenge (log axes place annotations by log10)
+    if params.omega_lambda > 0 and params.w < 0:
+        fig.add_annotation(
+            x=1.5, y=np.log10(params.omega_lambda * 1.5 ** (-3 * params.w)),
+            text="Dark energy increases with space expansion,<br>challenging energy conservation",
+            showarrow=True,
+            arrowhead=1,
+            ax=40,
+            ay=-40
+        )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+@cached_figure(per_language=False)
+def _expansion_history_figure(params=DEFAULT_COSMOLOGY):
+    """Build the a(t) and H(t) chart of a Friedmann universe, against time in billions of years."""
+    a, t, hubble = cosmology.expanding_part(cosmology.solve(params))
+    t_gyr = (t * cosmology.HUBBLE_TIME_GYR).astype(np.float32)
+    age_gyr = cosmology.age(cosmology.solve(params)) * cosmology.HUBBLE_TIME_GYR
+    
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Scatter(x=t_gyr, y=a.astype(np.float32), mode='lines',
+                             name='Scale factor a(t)', line=dict(color='black')),
+                  secondary_y=False)
+    fig.add_trace(go.Scatter(x=t_gyr, y=hubble.astype(np.float32), mode='lines',
+                             name='Expansion rate H(t) / H₀', line=dict(color='green')),
+                  secondary_y=True)
+    fig.add_vline(x=age_gyr, line=dict(color='black', width=1, dash='dot'),
+                  annotation_text=f'Today: {age_gyr:.2f} Gyr')
+    fig.update_layout(title=f'Expansion History<br><sup>{cosmology.describe(params)}</sup>',
+                      legend=dict(x=0.01, y=0.99))
+    fig.update_xaxes(title_text='Time since the Big Bang (Gyr)')
+    fig.update_yaxes(title_text='Scale factor a (1 = present day)', secondary_y=False)
+    # H falls from enormous values just after the Big Bang; show the range around today
+    fig.update_yaxes(title_text='H / H₀', type='log', secondary_y=True,
+                     range=[np.log10(np.nanmin(hubble)) - 0.2, 1.5])
+    return fig
+
+@cached_figure(per_language=False)
+def _age_map_figure(params=DEFAULT_COSMOLOGY):
+    """Build a map of the age of the universe over Ω_m and Ω_Λ, marking the chosen parameters."""
+    # One vectorized Friedmann solve for the whole grid, cached by Ω_r and w
+    omega_m, omega_lambda, ages = cosmology.age_grid(params.omega_r, params.w)
+    
+    fig = go.Figure(go.Heatmap(x=omega_m.astype(np.float32), y=omega_lambda.astype(np.float32),
+                               z=ages.astype(np.float32), colorscale='Viridis',
+                               colorbar=dict(title='Age (Gyr)'),
+                               hovertemplate='Ω_m %{x:.2f}, Ω_Λ %{y:.2f}: %{z:.2f} Gyr<extra></extra>'))
+    # Spatially flat universes: Ω_m + Ω_Λ = 1 - Ω_r
+    flat = 1 - params.omega_r
+    fig.add_trace(go.Scatter(x=[0, flat], y=[flat, 0], mode='lines', name='Flat (Ω_k = 0)',
+                             line=dict(color='white', dash='dash')))
+    fig.add_trace(go.Scatter(x=[params.omega_m], y=[params.omega_lambda], mode='markers',
+                             name='Selected universe',
+                             marker=dict(color='red', size=12, symbol='x')))
+    fig.update_layout(
+        title=(f'Age of the Universe across Ω_m and Ω_Λ'
+               f'<br><sup>Ω_r = {params.omega_r:g}, w = {params.w:g}; blank: no Big Bang, '
+               f'or recollapse before today</sup>'),
+        xaxis_title='Ω_m', yaxis_title='Ω_Λ',
+        legend=dict(x=0.99, y=0.99, xanchor='right'),
+    )
+    return fig
+
+@fragment
+@instrumented("visualization")
+def dark_energy_visualization():
+    """Create visualization of dark energy and its challenge to conservation."""
+    params = cosmology_controls()
+    show_figure(_dark_energy_figure(params))
+    if reaches_today(params):
+        show_figure(_expansion_history_figure(params))
+    else:
+        st.warning("These parameters give a universe without a Big Bang, or one that recollapses "
+                   "before reaching today's size, so it has no expansion history up to today.")
+    show_figure(_age_map_figure(params))
     
     st.markdown("""
     This graph illustrates how different energy forms behave as the universe expands:
@@ -335,80 +896,80 @@ def dark_energy_visualization():
        - Total energy decreases as a^-1
     
     3. **Dark Energy** (purple): 
-       - Density remains constant 
-       - Total energy increases proportionally to volume
+       - Density remains constant for a cosmological constant (w = -1), and in general
+         scales as a^(-3(1+w))
+       - Total energy increases proportionally to volume (as a^(-3w))
     
     The challenge to conservation comes from dark energy's behavior: 
     As the universe expands, the total dark energy increases with no identified source.
     
+    All curves come from integrating the Friedmann equation for the chosen Ω_m, Ω_r, Ω_Λ
+    and w: the expansion history shows the resulting a(t) and H(t), and the map shows the
+    age of the universe for every combination of Ω_m and Ω_Λ.
+    
     This represents a fundamental challenge to the standard formulation of energy conservation.
     """)
 
+# Initial masses the slider offers, in log10 kg: asteroid-sized black holes up to
+# ten thousand solar masses. The default evaporates in about the age of the universe
+BLACK_HOLE_LOG_MASSES = (5.0, 34.0, 0.1)
+DEFAULT_BLACK_HOLE_LOG_MASS = 11.2
+
+@cached_figure(per_language=False)
+def _black_hole_thermodynamics_figure(log_mass0=DEFAULT_BLACK_HOLE_LOG_MASS):
+    """Build the mass, temperature and radiation chart for an evaporating black hole."""
+    # Curves for every slider position come from one vectorized, cached call
+    curves = hawking.select(hawking.curve_table(*BLACK_HOLE_LOG_MASSES), log_mass0)
+    
+    # Plotted against the time left before evaporation, on a reversed log axis so
+    # time still runs left to right. Mass falls as τ^(1/3), temperature rises as
+    # 1/M and power as 1/M², so all three are straight lines on log-log axes, one
+    # panel each (on shared axes they would coincide)
+    # Float64 throughout: lifetimes reach 10^85 s, beyond float32's range
+    remaining = 10**curves.log_remaining
+    series = (
+        (curves.log_mass, 'Mass', 'Black Hole Mass (kg)', 'blue', 'Black hole mass decreases'),
+        (curves.log_temperature, 'Temperature', 'Temperature (K)', 'red', 'Temperature increases'),
+        (curves.log_power, 'Radiation', 'Radiation (W)', 'green', 'Radiation accelerates'),
+    )
+    
+    lifetime_years = curves.log_lifetime - np.log10(hawking.SECONDS_PER_YEAR)
+    fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.04)
+    middle = len(remaining) // 2
+    for row, (log_values, name, label, color, note) in enumerate(series, start=1):
+        fig.add_trace(go.Scatter(x=remaining, y=10**log_values, mode='lines',
+                                 name=name, line=dict(color=color)), row=row, col=1)
+        fig.update_yaxes(type='log', title_text=label, title_font_color=color, row=row, col=1)
+        # Log axes place annotations by log10 value, which the curves already are
+        fig.add_annotation(x=curves.log_remaining[middle], y=log_values[middle], text=note,
+                           showarrow=True, arrowhead=1, arrowcolor=color, ax=-80, ay=-30,
+                           row=row, col=1)
+    fig.update_xaxes(type='log', autorange='reversed')
+    fig.update_xaxes(title_text='Time remaining until evaporation (s)', row=3, col=1)
+    fig.update_layout(
+        title=('Black Hole Evaporation via Hawking Radiation'
+               f'<br><sup>M₀ = 10^{curves.log_mass0:.1f} kg, '
+               f'lifetime 10^{lifetime_years:.1f} years</sup>'),
+        height=650,
+        showlegend=False,
+    )
+    return fig
+
+@fragment
+@instrumented("visualization")
 def black_hole_thermodynamics_visualization():
     """Create visualization of black hole evaporation and its energy implications."""
-    # Data for black hole mass vs time and temperature vs time
-    time = np.linspace(0, 10, 100)
-    
-    # Stephen Hawking's equations for black hole evaporation
-    # M(t) = M_0 * (1 - t/t_evap)^(1/3)
-    # Where t_evap is the evaporation time
-    
-    initial_mass = 1.0
-    evaporation_time = 10  # Set to our max time for visualization
-    
-    mass = initial_mass * (1 - time/evaporation_time)**(1/3)
-    
-    # Temperature is inversely proportional to mass
-    temperature = 1 / mass
-    
-    # Radiation output is proportional to T^4 / M^2
-    radiation = temperature**4
-    
-    # Create the figure with two y-axes
-    fig, ax1 = plt.subplots(figsize=(10, 6))
-    
-    # Plot mass on first axis
-    ax1.set_xlabel('Time')
-    ax1.set_ylabel('Black Hole Mass', color='blue')
-    ax1.plot(time, mass, 'b-', label='Mass')
-    ax1.tick_params(axis='y', labelcolor='blue')
-    ax1.set_ylim(0, 1.1)
-    
-    # Create a second y-axis for temperature
-    ax2 = ax1.twinx()
-    ax2.set_ylabel('Hawking Radiation Temperature', color='red')
-    ax2.plot(time, temperature, 'r-', label='Temperature')
-    ax2.tick_params(axis='y', labelcolor='red')
-    
-    # Create a third y-axis for radiation output
-    ax3 = ax1.twinx()
-    ax3.spines['right'].set_position(('outward', 60))
-    ax3.set_ylabel('Radiation Emission Rate', color='green')
-    ax3.plot(time, radiation, 'g-', label='Radiation')
-    ax3.tick_params(axis='y', labelcolor='green')
-    
-    # Title
-    plt.title('Black Hole Evaporation via Hawking Radiation')
-    
-    # Add annotations
-    plt.annotate('Black hole mass decreases', xy=(5, 0.7), xytext=(3, 0.5),
-                arrowprops=dict(facecolor='blue', shrink=0.05))
-    
-    plt.annotate('Temperature increases', xy=(7, 1.5), xytext=(5, 2),
-                arrowprops=dict(facecolor='red', shrink=0.05))
-    
-    plt.annotate('Radiation accelerates', xy=(8, 4), xytext=(6, 5),
-                arrowprops=dict(facecolor='green', shrink=0.05))
-    
-    # Add legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    lines3, labels3 = ax3.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2 + lines3, labels1 + labels2 + labels3, loc='upper right')
-    
-    plt.tight_layout()
-    
-    st.pyplot(fig)
+    low, high, step = BLACK_HOLE_LOG_MASSES
+    log_mass0 = st.slider("Initial black hole mass (log₁₀ kg)", min_value=low, max_value=high,
+                          value=DEFAULT_BLACK_HOLE_LOG_MASS, step=step, format="%.1f")
+    log_mass0 = round(log_mass0, 1)
+    show_figure(_black_hole_thermodynamics_figure(log_mass0))
+    
+    lifetime_years = 10**(hawking.log_lifetime(log_mass0) - np.log10(hawking.SECONDS_PER_YEAR))
+    st.caption(f"Mass {10**log_mass0:.3g} kg ({10**log_mass0 / hawking.SOLAR_MASS:.3g} solar masses), "
+               f"initial temperature {10**hawking.log_temperature(log_mass0):.3g} K, "
+               f"lifetime {hawking.format_duration(hawking.log_lifetime(log_mass0))} "
+               f"({lifetime_years / hawking.AGE_OF_UNIVERSE_YEARS:.3g} × the age of the universe)")
     
     st.markdown("""
     This visualization shows the process of black hole evaporation through Hawking radiation:
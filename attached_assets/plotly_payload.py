@@ -0,0 +1,134 @@
+"""
+Compact encoding of Plotly figures before they are sent to the browser.
+
+st.plotly_chart serializes a figure with plotly.io.to_json. NumPy arrays go out as
+base64 typed arrays ({"dtype": "f4", "bdata": ...}), but lists go out as JSON text,
+float64 arrays are twice the size a chart needs, and surfaces built from meshgrids
+carry two full grids of coordinates that are really two 1D axes. compact_figure
+rewrites the data of every trace, including animation frames, in place:
+
+- meshgrid x and y of surfaces, heatmaps and contours become their 1D axes
+- numeric lists become arrays, so they are sent as typed arrays
+- float64 becomes float32 and int64 becomes int32 when the values fit; data beyond
+  float32's range (such as the black hole's lifetimes) keeps its precision
+- if the data is still over max_bytes, 2D grids are thinned by an integer stride
+  until it fits; a figure that cannot be brought under the budget is logged as a
+  "payload"/"over_budget" instrumentation event
+
+cached_figure applies it to every Plotly figure it caches, so it runs once per build.
+"""
+
+import time
+
+import numpy as np
+
+import instrumentation
+
+# Trace data budget for one figure, in base64 bytes: a 512 x 512 float32 surface fits
+DEFAULT_MAX_FIGURE_BYTES = 2_000_000
+
+# Data properties rewritten on every trace
+DATA_PROPERTIES = ("x", "y", "z", "customdata")
+
+# Trace types whose x and y may be 1D axes of a 2D z
+GRID_TRACES = ("surface", "heatmap", "contour")
+
+# Lists shorter than this are cheaper as JSON text than as a typed array
+MIN_ARRAY_LENGTH = 8
+
+# float32 keeps values of magnitude in this range without overflow or underflow
+FLOAT32_RANGE = (1e-30, 1e30)
+
+# Set to False to send figures exactly as built, e.g. to measure the savings
+enabled = True
+
+def _compact_array(value):
+    """value as the smallest array that draws the same, or value itself if not numeric."""
+    if isinstance(value, (list, tuple)):
+        if len(value) < MIN_ARRAY_LENGTH:
+            return value
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            return value  # Ragged
+        if array.dtype.kind not in "biuf":
+            return value  # Text, dates or mixed
+        value = array
+    if not isinstance(value, np.ndarray):
+        return value
+    if value.dtype == np.float64:
+        magnitudes = np.abs(value[np.isfinite(value) & (value != 0)])
+        if magnitudes.size == 0 or (magnitudes.min() >= FLOAT32_RANGE[0]
+                                    and magnitudes.max() <= FLOAT32_RANGE[1]):
+            return value.astype(np.float32)
+    elif value.dtype == np.int64 and value.size:
+        info = np.iinfo(np.int32)
+        if info.min <= value.min() and value.max() <= info.max:
+            return value.astype(np.int32)
+    return value
+
+def _replace(trace, name, value):
+    """Set trace.name to value even when it compares equal to the current data."""
+    # Plotly ignores assignments equal to the current value, which a list and its
+    # array, or a float64 array and its float32 copy, are
+    setattr(trace, name, None)
+    setattr(trace, name, value)
+
+def _grid_axes(trace):
+    """Replace meshgrid x and y of a grid trace by the 1D axes they repeat."""
+    x, y = trace.x, trace.y
+    if isinstance(x, np.ndarray) and x.ndim == 2 and np.all(x == x[:1]):
+        trace.x = x[0]
+    if isinstance(y, np.ndarray) and y.ndim == 2 and np.all(y == y[:, :1]):
+        trace.y = y[:, 0]
+
+def _traces(fig):
+    yield from fig.data
+    for frame in fig.frames or ():
+        yield from frame.data or ()
+
+def data_nbytes(fig):
+    """Base64 bytes of the typed-array data in fig's traces and frames."""
+    total = 0
+    for trace in _traces(fig):
+        for name in DATA_PROPERTIES:
+            value = getattr(trace, name, None)
+            if isinstance(value, np.ndarray):
+                total += (value.nbytes + 2) // 3 * 4
+    return total
+
+def _thin_grids(fig, stride):
+    """Keep every stride-th row and column of the 2D grids in fig."""
+    for trace in _traces(fig):
+        if trace.type not in GRID_TRACES or not isinstance(trace.z, np.ndarray) or trace.z.ndim != 2:
+            continue
+        trace.z = trace.z[::stride, ::stride]
+        for name in ("x", "y"):
+            axis = getattr(trace, name)
+            if isinstance(axis, np.ndarray) and axis.ndim == 1:
+                setattr(trace, name, axis[::stride])
+
+def compact_figure(fig, max_bytes=DEFAULT_MAX_FIGURE_BYTES):
+    """Rewrite fig's data for a smaller payload (see the module docstring); returns fig."""
+    if not enabled:
+        return fig
+    start = time.perf_counter()
+    for trace in _traces(fig):
+        if trace.type in GRID_TRACES:
+            _grid_axes(trace)
+        for name in DATA_PROPERTIES:
+            value = getattr(trace, name, None)
+            compact = _compact_array(value)
+            if compact is not value:
+                _replace(trace, name, compact)
+
+    nbytes = data_nbytes(fig)
+    if nbytes > max_bytes:
+        # Thinning both axes by s divides a grid's size by s²
+        _thin_grids(fig, int(np.ceil(np.sqrt(nbytes / max_bytes))))
+        nbytes = data_nbytes(fig)
+    if instrumentation.enabled:
+        seconds = time.perf_counter() - start
+        instrumentation.record("payload", "over_budget" if nbytes > max_bytes else "compact",
+                               seconds, nbytes)
+    return fig
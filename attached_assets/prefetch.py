@@ -0,0 +1,152 @@
+"""
+Background prefetch of the figures on the slides next to the one being viewed.
+
+Viewers almost always step through the deck in order, so while one slide is being
+read the figures of the previous and next sections can already be built into the
+shared figure cache. prefetch_around(section_id), called once a section has
+rendered, queues the cached figure builders listed in those sections'
+Section.prefetch on a background thread:
+
+- builds go through the render scheduler at PREFETCH priority, so a viewer's own
+  build always takes a free slot first, and a full queue sheds prefetches
+- a section that no session is next to any more is cancelled before its next build
+- after each build the thread sleeps long enough to keep its CPU time within
+  cpu_budget of one core (PRESENTATION_PREFETCH_CPU, default 0.5; 0 turns
+  prefetching off)
+
+Figures are built for the language and theme of the session that asked, so they
+are cached under the keys that session will look up. Data tables are DataFrame
+literals built as the slide renders and are not worth prefetching.
+"""
+
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+import instrumentation
+from sections import SECTION_IDS, SECTIONS, load_section
+
+ENV_VAR = "PRESENTATION_PREFETCH_CPU"
+
+# Share of one core the prefetch thread may use
+DEFAULT_CPU_BUDGET = 0.5
+
+# Session state key of the targets a session is waiting on
+SESSION_KEY = "_prefetch_targets"
+
+cpu_budget = float(os.environ.get(ENV_VAR) or DEFAULT_CPU_BUDGET)
+
+_executor = None
+_targets = {}  # (section_id, language, theme) -> _Target queued or running
+_lock = threading.Lock()
+
+
+class _Target:
+    """The figures of one section for one language and theme, and who still wants them."""
+
+    def __init__(self, key):
+        self.key = key
+        self.sessions = 0
+        self.cancelled = threading.Event()
+
+
+def enabled():
+    """Whether adjacent sections are prefetched."""
+    return cpu_budget > 0
+
+
+def neighbours(section_id):
+    """The sections before and after section_id in sidebar order."""
+    index = SECTION_IDS.index(section_id)
+    return [SECTION_IDS[i] for i in (index + 1, index - 1) if 0 <= i < len(SECTION_IDS)]
+
+
+def _submit(target):
+    global _executor
+    if _executor is None:
+        # One thread: prefetching is background work and one core's share caps it anyway
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+    _executor.submit(_prefetch, target)
+
+
+def prefetch_around(section_id):
+    """Prefetch the figures of the sections next to section_id for the current session."""
+    if not enabled():
+        return
+    wanted = {neighbour for neighbour in neighbours(section_id) if SECTIONS[neighbour].prefetch}
+    if wanted:
+        # Imported here, once this section has rendered and a neighbour has figures, so
+        # the figure stack is not part of a plain-text slide's cold start
+        from figure_cache import current_settings
+        language, theme = current_settings()
+        wanted = {(neighbour, language, theme) for neighbour in wanted}
+    previous = st.session_state.get(SESSION_KEY, {})
+    targets = {}
+    with _lock:
+        for key, target in previous.items():
+            if key in wanted:
+                # Queued, running or done; a target this session holds is never cancelled
+                targets[key] = target
+                continue
+            # The session moved away: drop its interest, and the target if it was the last
+            target.sessions -= 1
+            if target.sessions <= 0:
+                target.cancelled.set()
+                if _targets.get(key) is target:
+                    del _targets[key]
+        for key in wanted - targets.keys():
+            target = _targets.get(key)
+            if target is None:
+                target = _targets[key] = _Target(key)
+                _submit(target)
+            target.sessions += 1
+            targets[key] = target
+    st.session_state[SESSION_KEY] = targets
+
+
+def _build_all(section_id, cancelled):
+    """Run a section's prefetch builders, pausing after each to stay within the CPU budget."""
+    from render_scheduler import Overloaded
+    for entry in SECTIONS[section_id].prefetch:
+        if cancelled.is_set():
+            return
+        module_name, _, name = entry.partition(":")
+        builder = getattr(importlib.import_module(module_name), name)
+        used = time.thread_time()
+        try:
+            builder()
+        except Overloaded:
+            # Viewers are queued for builds; leave the rest of the section to them
+            return
+        except Exception:
+            # A broken figure shows its error when its slide is opened, not here
+            continue
+        used = time.thread_time() - used
+        if cpu_budget < 1:
+            cancelled.wait(used * (1 / cpu_budget - 1))
+
+
+def _prefetch(target):
+    from figure_cache import render_settings
+    from render_scheduler import PREFETCH, current_priority
+    section_id, language, theme = target.key
+    start = time.perf_counter()
+    settings_token = render_settings.set((language, theme))
+    priority_token = current_priority.set(PREFETCH)
+    try:
+        if not target.cancelled.is_set():
+            load_section(section_id)
+            _build_all(section_id, target.cancelled)
+    finally:
+        current_priority.reset(priority_token)
+        render_settings.reset(settings_token)
+        with _lock:
+            if _targets.get(target.key) is target:
+                del _targets[target.key]
+    if instrumentation.enabled:
+        name = "cancelled" if target.cancelled.is_set() else "done"
+        instrumentation.record("prefetch", name, time.perf_counter() - start, section=section_id)
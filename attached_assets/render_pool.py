@@ -0,0 +1,112 @@
+"""
+Optional process pool for rasterizing matplotlib figures.
+
+Agg drawing holds the GIL for the whole savefig, so when many sessions render at
+once their figures are drawn one after another and every other script on the
+server waits too. With PRESENTATION_RENDER_PROCESSES set to a number of processes,
+figure_png pickles each figure in the session thread (its spec: artists, data and
+styles, a few milliseconds of work) and a warm ProcessPoolExecutor draws it and
+returns the PNG bytes, which are identical to an in-process render.
+
+A render that fails to pickle, raises in the worker or takes longer than
+timeout_seconds falls back to drawing in-process, logged as a "render" event named
+"fallback:<reason>"; a pool whose workers died is replaced on the next render.
+"""
+
+import io
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import instrumentation
+
+ENV_VAR = "PRESENTATION_RENDER_PROCESSES"
+
+# Longest wait for a worker before drawing in-process instead
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+processes = int(os.environ.get(ENV_VAR) or 0)
+timeout_seconds = DEFAULT_TIMEOUT_SECONDS
+
+_pool = None
+_lock = threading.Lock()
+
+def _warm_up():
+    """Import Agg and draw once, so a worker's first real render pays no start-up cost."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(1, 1))
+    FigureCanvasAgg(fig)
+    fig.savefig(io.BytesIO(), format="png")
+
+def _render(spec, savefig_options):
+    """Worker side: rebuild a pickled figure and return it as image bytes."""
+    fig = pickle.loads(spec)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **savefig_options)
+    return buffer.getvalue()
+
+def enabled():
+    """Whether figures are rasterized in worker processes."""
+    return processes > 0
+
+def start(count=None):
+    """Start the pool (default: PRESENTATION_RENDER_PROCESSES workers) and warm every worker."""
+    global _pool, processes
+    with _lock:
+        if count is not None:
+            processes = count
+        if _pool is not None or processes <= 0:
+            return _pool
+        # A forkserver child starts from a clean interpreter, not a copy of the
+        # server's threads and locks
+        context = multiprocessing.get_context("forkserver")
+        _pool = ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                                    initializer=_warm_up)
+        pool = _pool
+    # Workers are spawned on demand; one task each starts them all
+    for future in [pool.submit(os.getpid) for _ in range(processes)]:
+        future.result()
+    return pool
+
+def shutdown():
+    """Stop the workers; the next render starts a new pool if processes is still set."""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _discard(pool):
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def rasterize(fig, savefig_options, timeout=None):
+    """Draw fig in a worker process and return the bytes, or None to draw it in-process."""
+    if processes <= 0:
+        return None
+    pool = _pool or start()
+    reason = None
+    try:
+        spec = pickle.dumps(fig)
+        future = pool.submit(_render, spec, savefig_options)
+        return future.result(timeout=timeout_seconds if timeout is None else timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        reason = "timeout"
+    except BrokenProcessPool:
+        _discard(pool)
+        reason = "broken_pool"
+    except Exception as error:
+        # Unpicklable artists, or an error drawing in the worker
+        reason = type(error).__name__
+    if instrumentation.enabled:
+        instrumentation.record("render", f"fallback:{reason}", 0.0)
+    return None
@@ -0,0 +1,207 @@
+"""
+Single-flight deduplication and admission control for expensive figure builds.
+
+When a presenter moves to a slide, every audience session asks for the same figures
+at the same moment. RenderScheduler.run(key, factory) lets the first caller for a key
+build it while later callers for the same key wait for that one result, and limits
+how many different builds run at once:
+
+- at most max_concurrent builds run; the rest wait for a slot, best priority first
+  (VISIBLE, for the slide a viewer is looking at, before PREFETCH)
+- at most max_queued builds wait; beyond that a PREFETCH build is refused with
+  Overloaded, and a VISIBLE build displaces the newest waiting PREFETCH build or,
+  if there is none, waits anyway
+
+Builds run on the caller's thread, so context variables and the Streamlit script
+context stay in place. The priority of a build comes from current_priority, which
+prefetching code sets around its calls.
+"""
+
+import itertools
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+import instrumentation
+
+VISIBLE = 0
+PREFETCH = 1
+
+# Builds running at once; more would only contend for the GIL and the CPUs
+DEFAULT_MAX_CONCURRENT = os.cpu_count() or 1
+
+# Builds allowed to wait for a slot before prefetches are shed
+DEFAULT_MAX_QUEUED = 32
+
+# Priority of builds started on this thread
+current_priority = ContextVar("render_priority", default=VISIBLE)
+
+# Whether this thread is inside a build; a nested build uses its parent's slot
+_in_build = ContextVar("in_render_build", default=False)
+
+
+class Overloaded(RuntimeError):
+    """A PREFETCH build was shed because too many builds were already waiting."""
+
+
+class _Flight:
+    """One build in progress, and its outcome once it is known."""
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+    def finish(self, value=None, error=None):
+        self.value, self.error = value, error
+        self.done.set()
+
+
+class _Ticket:
+    """A build waiting for a slot; order is (priority, arrival)."""
+
+    def __init__(self, flight, sequence):
+        self.flight = flight
+        self.sequence = sequence
+        self.shed = False
+
+    def order(self):
+        return (self.flight.priority, self.sequence)
+
+
+class RenderScheduler:
+    """Runs builds keyed by figure, at most one per key and max_concurrent in total."""
+
+    def __init__(self, max_concurrent=DEFAULT_MAX_CONCURRENT, max_queued=DEFAULT_MAX_QUEUED):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self._condition = threading.Condition()
+        self._flights = {}  # key -> _Flight being built
+        self._waiting = []  # _Tickets of builds waiting for a slot
+        self._running = 0
+        self._sequence = itertools.count()
+        self.builds = 0
+        self.joined = 0
+        self.queued = 0
+        self.shed = 0
+
+    def run(self, key, factory, priority=None):
+        """Return factory() for key, sharing one call among concurrent callers of the same key.
+
+        Raises Overloaded if a PREFETCH build is shed.
+        """
+        if priority is None:
+            priority = current_priority.get()
+        with self._condition:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(priority)
+            else:
+                self.joined += 1
+                # A viewer waiting on a prefetch makes it urgent
+                flight.priority = min(flight.priority, priority)
+        if not leader:
+            return self._follow(key, factory, flight, priority)
+
+        nested = _in_build.get()
+        try:
+            if not nested:
+                self._acquire(flight)
+        except Overloaded as error:
+            with self._condition:
+                del self._flights[key]
+            flight.finish(error=error)
+            raise
+        token = _in_build.set(True)
+        try:
+            value = factory()
+        except BaseException as error:
+            flight.finish(error=error)
+            raise
+        else:
+            flight.finish(value)
+            return value
+        finally:
+            _in_build.reset(token)
+            with self._condition:
+                self.builds += 1
+                if not nested:
+                    self._running -= 1
+                del self._flights[key]
+                self._condition.notify_all()
+
+    def _follow(self, key, factory, flight, priority):
+        start = time.perf_counter()
+        flight.done.wait()
+        if instrumentation.enabled:
+            instrumentation.record("schedule", "joined", time.perf_counter() - start)
+        error = flight.error
+        if error is None:
+            return flight.value
+        # A leader stopped by its own session (Streamlit's rerun and stop exceptions
+        # are BaseExceptions), or a prefetch shed just before a viewer joined it:
+        # build it again here rather than pass that on
+        if not isinstance(error, Exception) or (isinstance(error, Overloaded) and priority < PREFETCH):
+            return self.run(key, factory, priority)
+        raise error
+
+    def _acquire(self, flight):
+        """Wait for a build slot, best priority first; raises Overloaded if shed."""
+        with self._condition:
+            if self._running < self.max_concurrent and not self._waiting:
+                self._running += 1
+                return
+            if len(self._waiting) >= self.max_queued:
+                self._shed_for(flight)
+            ticket = _Ticket(flight, next(self._sequence))
+            self._waiting.append(ticket)
+            self.queued += 1
+            start = time.perf_counter()
+            while not ticket.shed and not (self._running < self.max_concurrent
+                                           and min(self._waiting, key=_Ticket.order) is ticket):
+                self._condition.wait()
+            if ticket.shed:
+                raise Overloaded("Render queue is full")
+            self._waiting.remove(ticket)
+            self._running += 1
+        if instrumentation.enabled:
+            instrumentation.record("schedule", "queued", time.perf_counter() - start)
+
+    def _shed_for(self, flight):
+        """Make room in a full queue for flight, or refuse it; called with the lock held."""
+        lower = [ticket for ticket in self._waiting if ticket.flight.priority > flight.priority]
+        if not lower:
+            if flight.priority >= PREFETCH:
+                self.shed += 1
+                if instrumentation.enabled:
+                    instrumentation.record("schedule", "shed", 0.0)
+                raise Overloaded("Render queue is full")
+            return  # A visible build waits even in a full queue
+        victim = max(lower, key=_Ticket.order)
+        victim.shed = True
+        self._waiting.remove(victim)
+        self.shed += 1
+        if instrumentation.enabled:
+            instrumentation.record("schedule", "shed", 0.0)
+        self._condition.notify_all()
+
+    def stats(self):
+        """Return build, join, queue and shed counters and the current load."""
+        with self._condition:
+            return {
+                "builds": self.builds,
+                "joined": self.joined,
+                "queued": self.queued,
+                "shed": self.shed,
+                "running": self._running,
+                "waiting": len(self._waiting),
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+            }
+
+
+# The scheduler shared by every session in this process
+scheduler = RenderScheduler()
@@ -0,0 +1,102 @@
+"""
+Registry of presentation sections, in sidebar order.
+
+Sections are keyed by stable IDs. Each one names the translation key of its title,
+the module and function that render it, the heavy modules it needs, whether its
+output can be shared between sessions and the cached figure builders that
+prefetch.py can run ahead of time. Nothing is imported until the section is
+shown for the first time, so a viewer of a plain-text slide never loads the
+plotting stack.
+"""
+
+import importlib
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+import instrumentation
+from translations import get_translation
+
+Section = namedtuple("Section", ["title_key", "module", "function", "requires", "cacheable", "prefetch"],
+                     defaults=((),))
+
+# Cacheable sections render the same output for every session in a given language;
+# sections with widgets depend on per-session state and are not
+SECTIONS = {
+    "introduction": Section("introduction", "slides", "display_introduction_slide",
+                            (), True,
+                            ("slides:_energy_transformations_figure",)),
+    "historical_context": Section("historical_context", "slides", "display_historical_context_slide",
+                                  ("pandas", "plotly.express"), True,
+                                  ("slides:_absolutism_timeline_figure",)),
+    "definitions": Section("definitions", "slides", "display_definitions_slide",
+                           (), True,
+                           ("slides:_physics_domains_figure",)),
+    "scientific_evidence": Section("scientific_evidence", "slides", "display_scientific_evidence_slide",
+                                   ("pandas", "physics_models"), False,
+                                   ("physics_models:_virtual_particle_figure",
+                                    "physics_models:_spacetime_expansion_panels_figure",
+                                    "physics_models:_spacetime_expansion_energy_figure")),
+    "quantum_mechanics": Section("quantum_mechanics", "slides", "display_quantum_mechanics_slide",
+                                 ("numpy", "physics_models"), False,
+                                 ("physics_models:_quantum_fluctuation_figure", "physics_models:_tunneling_animation")),
+    "cosmological": Section("cosmological", "slides", "display_cosmological_slide",
+                            ("physics_models",), False,
+                            ("physics_models:_dark_energy_figure", "physics_models:_expansion_history_figure",
+                             "physics_models:_age_map_figure", "physics_models:_black_hole_thermodynamics_figure")),
+    "philosophical": Section("philosophical", "philosophical_arguments", "display_philosophical_argument_slide",
+                             ("numpy", "pandas"), True,
+                             ("philosophical_arguments:_philosophical_positions_figure",)),
+    "logical_fallacies": Section("logical_fallacies", "philosophical_arguments", "display_logical_fallacies_slide",
+                                 ("numpy", "pandas"), True,
+                                 ("philosophical_arguments:_bayesian_update_figure",)),
+    "formal_logic": Section("formal_logic", "philosophical_arguments", "display_formal_logic_slide",
+                            ("numpy", "pandas"), True),
+    "metaphysical": Section("metaphysical", "philosophical_arguments", "display_metaphysical_arguments_slide",
+                            ("numpy", "pandas"), True,
+                            ("philosophical_arguments:_time_models_figure",
+                             "philosophical_arguments:_conservation_scales_figure")),
+    "conclusion": Section("conclusion", "slides", "display_conclusion_slide",
+                          ("pandas",), True),
+    "references": Section("references", "references", "display_references", (), True),
+}
+
+SECTION_IDS = list(SECTIONS)
+
+# Render functions of sections that have already been loaded in this process
+_loaded = {}
+_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def section_labels(language):
+    """Translated sidebar labels for every section, resolved once per language."""
+    return MappingProxyType({
+        section_id: get_translation(section.title_key, language)
+        for section_id, section in SECTIONS.items()
+    })
+
+def load_section(section_id):
+    """Import a section's modules on first use and return its render function."""
+    render = _loaded.get(section_id)
+    if render is None:
+        with _lock:
+            render = _loaded.get(section_id)
+            if render is None:
+                section = SECTIONS[section_id]
+                for name in section.requires:
+                    importlib.import_module(name)
+                module = importlib.import_module(section.module)
+                render = getattr(module, section.function)
+                _loaded[section_id] = render
+    return render
+
+def render_section(section_id):
+    """Render a section, importing its modules first if needed."""
+    render = load_section(section_id)
+    token = instrumentation.current_section.set(section_id)
+    try:
+        with instrumentation.timed("section", section_id):
+            render()
+    finally:
+        instrumentation.current_section.reset(token)
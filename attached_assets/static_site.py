@@ -0,0 +1,282 @@
+"""
+Static site build of the whole presentation.
+
+Renders every section in the app.py sidebar, in every language in
+translations.translations, to plain HTML pages with pre-rendered figures:
+matplotlib charts become PNG files and Plotly charts are embedded as JSON specs.
+Pages render in parallel across a process pool. A page is rebuilt only when its
+inputs change: the slide function source, the local modules it depends on (where
+its data lives) and the translation strings for its language.
+
+Usage:
+    python static_site.py [--out site] [--workers N] [--force]
+"""
+
+import argparse
+import ast
+import hashlib
+import html
+import importlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sections import SECTION_IDS, SECTIONS, section_labels
+from translations import get_translation, translations
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_NAME = "manifest.json"
+
+# Bump to force a full rebuild when the page template changes in a way the
+# source hashes don't capture
+BUILD_VERSION = 1
+
+# Page renderer sources also feed every page hash
+BUILDER_SOURCES = ("static_site.py", "headless.py")
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="{language}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - {app_title}</title>
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.css">
+<script src="https://cdn.jsdelivr.net/npm/marked@12/marked.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/marked-katex-extension@5/lib/index.umd.js"></script>
+{plotly_script}
+<style>
+body {{ margin: 0; font-family: "Source Sans Pro", sans-serif; display: flex; color: #31333f; }}
+nav {{ width: 260px; min-height: 100vh; padding: 1.5rem; background: #f0f2f6; box-sizing: border-box; }}
+nav a {{ display: block; padding: 0.25rem 0; color: inherit; text-decoration: none; }}
+nav a.current {{ font-weight: bold; }}
+main {{ flex: 1; max-width: 1100px; padding: 2rem 3rem; }}
+main img {{ max-width: 100%; }}
+table {{ border-collapse: collapse; width: 100%; margin: 1rem 0; }}
+th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+.widget {{ color: #808495; font-size: 0.9rem; }}
+</style>
+</head>
+<body>
+<nav>
+<h2>Navigation</h2>
+<p>{language_links}</p>
+<p>{select_section}</p>
+{section_links}
+</nav>
+<main>
+{body}
+</main>
+<script>
+marked.use(markedKatex({{throwOnError: false}}));
+document.querySelectorAll("script[type='text/markdown']").forEach(function (source) {{
+  var target = document.createElement("div");
+  target.innerHTML = marked.parse(source.textContent);
+  source.replaceWith(target);
+}});
+</script>
+</body>
+</html>
+"""
+
+LANGUAGE_NAMES = {"en": "English", "so": "Somali"}
+CURRENT_CLASS = ' class="current"'
+
+def _local_module_path(name):
+    path = os.path.join(ASSETS_DIR, name.split(".")[0] + ".py")
+    return path if os.path.exists(path) else None
+
+def _local_dependencies(module_name, seen=None):
+    """Paths of the presentation modules module_name imports, directly or indirectly."""
+    seen = set() if seen is None else seen
+    path = _local_module_path(module_name)
+    if path is None or path in seen:
+        return seen
+    seen.add(path)
+    with open(path, encoding="utf-8") as source:
+        tree = ast.parse(source.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            _local_dependencies(name, seen)
+    return seen
+
+def page_inputs_hash(section_id, language):
+    """Hash everything a page's output depends on."""
+    section = SECTIONS[section_id]
+    digest = hashlib.sha256(f"{BUILD_VERSION}:{section_id}:{language}".encode())
+
+    # The slide function itself, then every local module it can reach
+    module = importlib.import_module(section.module)
+    render = getattr(module, section.function)
+    digest.update(inspect.getsource(render).encode())
+    module_path = _local_module_path(section.module)
+    paths = set(_local_dependencies(section.module)) - {module_path}
+    for name in section.requires:
+        paths |= _local_dependencies(name)
+    paths |= {os.path.join(ASSETS_DIR, name) for name in BUILDER_SOURCES}
+    for path in sorted(paths):
+        with open(path, "rb") as source:
+            digest.update(source.read())
+
+    # Translation strings, including the sidebar labels shown on every page
+    digest.update(json.dumps(translations.get(language, {}), sort_keys=True).encode())
+    return digest.hexdigest()
+
+def _write_asset(out_dir, data, extension):
+    """Write a content-addressed asset and return its path relative to a page."""
+    name = hashlib.sha256(data).hexdigest()[:16] + extension
+    path = os.path.join(out_dir, "assets", name)
+    if not os.path.exists(path):
+        with open(path, "wb") as asset:
+            asset.write(data)
+    return f"../assets/{name}"
+
+def _plotly_json(figure):
+    import plotly.io
+    return plotly.io.to_json(figure, validate=False)
+
+def _table_html(data):
+    import pandas as pd
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data)
+    return data.to_html(border=0)
+
+def render_elements(elements, out_dir):
+    """Convert recorded elements to HTML; returns (body, uses_plotly)."""
+    parts = []
+    uses_plotly = False
+    for index, element in enumerate(elements):
+        kind, payload = element.kind, element.payload
+        if kind == "markdown":
+            # Rendered client-side so markdown and LaTeX match the live app
+            body = payload.replace("</script", "<\\/script")
+            parts.append(f'<script type="text/markdown">{body}</script>')
+        elif kind == "title":
+            parts.append(f"<h1>{html.escape(payload)}</h1>")
+        elif kind == "header":
+            parts.append(f"<h2>{html.escape(payload)}</h2>")
+        elif kind == "subheader":
+            parts.append(f"<h3>{html.escape(payload)}</h3>")
+        elif kind in ("caption", "text"):
+            parts.append(f"<p>{html.escape(str(payload))}</p>")
+        elif kind == "table":
+            parts.append(_table_html(payload))
+        elif kind == "image":
+            src = _write_asset(out_dir, payload, ".png")
+            parts.append(f'<img src="{src}" alt="">')
+        elif kind == "plotly":
+            uses_plotly = True
+            spec = _plotly_json(payload).replace("</", "<\\/")
+            parts.append(
+                f'<div id="chart-{index}"></div><script>'
+                f'(function () {{ var spec = {spec}; '
+                f'Plotly.newPlot("chart-{index}", spec.data, spec.layout, {{responsive: true}}); }})();'
+                f'</script>'
+            )
+        elif kind == "widget":
+            label, value = payload
+            parts.append(f'<p class="widget">{html.escape(str(label))}: {html.escape(str(value))}</p>')
+    return "\n".join(parts), uses_plotly
+
+def build_page(section_id, language, out_dir):
+    """Render one section in one language and write its HTML page."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from headless import recording
+    from sections import render_section
+
+    with recording(language) as recorder:
+        render_section(section_id)
+    body, uses_plotly = render_elements(recorder.elements, out_dir)
+
+    def t(key):
+        return html.escape(get_translation(key, language))
+
+    # The same titles as the app's sidebar radio
+    labels = {other: html.escape(label) for other, label in section_labels(language).items()}
+    section_links = "\n".join(
+        f'<a href="{other}.html"{CURRENT_CLASS if other == section_id else ""}>{labels[other]}</a>'
+        for other in SECTION_IDS
+    )
+    language_links = " | ".join(
+        f'<a href="../{code}/{section_id}.html">{LANGUAGE_NAMES.get(code, code)}</a>'
+        for code in translations
+    )
+    page = PAGE_TEMPLATE.format(
+        language=language,
+        title=labels[section_id],
+        app_title=t("app_title"),
+        plotly_script=('<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>'
+                       if uses_plotly else ""),
+        language_links=language_links,
+        select_section=t("select_section"),
+        section_links=section_links,
+        body=body,
+    )
+    with open(os.path.join(out_dir, language, f"{section_id}.html"), "w", encoding="utf-8") as output:
+        output.write(page)
+    return section_id, language
+
+def build_site(out_dir, workers=None, force=False):
+    """Build every page whose inputs changed; returns (built, skipped) page keys."""
+    for language in translations:
+        os.makedirs(os.path.join(out_dir, language), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, "assets"), exist_ok=True)
+
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding="utf-8") as source:
+            manifest = json.load(source)
+
+    pending, skipped = {}, []
+    for language in translations:
+        for section_id in SECTION_IDS:
+            key = f"{language}/{section_id}"
+            inputs_hash = page_inputs_hash(section_id, language)
+            page_path = os.path.join(out_dir, language, f"{section_id}.html")
+            if manifest.get(key) == inputs_hash and os.path.exists(page_path):
+                skipped.append(key)
+            else:
+                pending[key] = inputs_hash
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(build_page, key.split("/")[1], key.split("/")[0], out_dir)
+                for key in pending
+            ]
+            for future in futures:
+                section_id, language = future.result()
+                manifest[f"{language}/{section_id}"] = pending[f"{language}/{section_id}"]
+                # Save after every page so an interrupted build keeps its progress
+                with open(manifest_path, "w", encoding="utf-8") as output:
+                    json.dump(manifest, output, indent=2, sort_keys=True)
+
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as output:
+        output.write(f'<!DOCTYPE html><meta http-equiv="refresh" content="0; url=en/{SECTION_IDS[0]}.html">')
+    return list(pending), skipped
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the presentation as a static site.")
+    parser.add_argument("--out", default="site", help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--force", action="store_true", help="rebuild every page")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    built, skipped = build_site(args.out, workers=args.workers, force=args.force)
+    print(f"Built {len(built)} pages, skipped {len(skipped)} unchanged "
+          f"in {time.perf_counter() - start:.1f}s -> {os.path.abspath(args.out)}")
+
+if __name__ == "__main__":
+    main()
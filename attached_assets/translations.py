@@ -2,6 +2,9 @@
 Contains translations for the presentation in different languages.
 """
 
+from collections import Counter
+from types import MappingProxyType
+
 # English to Somali translations
 translations = {
     "en": {
@@ -243,14 +246,48 @@ translations = {
     }
 }
 
+FALLBACK_LANGUAGE = "en"
+
+# Lookups of keys no language defines, counted by (language, key)
+missing_keys = Counter()
+
+
+class _Catalog(dict):
+    """Flat translation table for one language; unknown keys resolve to themselves."""
+
+    __slots__ = ("language",)
+
+    def __missing__(self, key):
+        missing_keys[(self.language, key)] += 1
+        return key
+
+
+def compile_catalogs(source=translations):
+    """Merge each language with the English fallback into flat, read-only tables."""
+    fallback = source[FALLBACK_LANGUAGE]
+    catalogs = {}
+    for language, strings in source.items():
+        table = _Catalog({**fallback, **strings})
+        table.language = language
+        catalogs[language] = MappingProxyType(table)
+    return catalogs
+
+
+# Compiled once at import; lookups are a single dict access with no exception handling
+catalogs = compile_catalogs()
+
+# Keys each language takes from the English fallback, recorded at compile time
+fallback_keys = {
+    language: sorted(set(translations[FALLBACK_LANGUAGE]) - set(strings))
+    for language, strings in translations.items()
+}
+
+
+def catalog(language):
+    """Return the compiled table for a language (English for unknown languages)."""
+    return catalogs.get(language) or catalogs[FALLBACK_LANGUAGE]
+
+
 def get_translation(key, language="en"):
     """Get translation for a particular key in the specified language."""
-    try:
-        return translations[language][key]
-    except KeyError:
-        # If the key is not found in the specified language, return the English version
-        try:
-            return translations["en"][key]
-        except KeyError:
-            # If the key is not found at all, return the key itself
-            return key
\ No newline at end of file
+    return catalog(language)[key]
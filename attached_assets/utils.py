@@ -1,8 +1,30 @@
+from functools import wraps
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
+import instrumentation
 # We don't need IPython display for Streamlit
 
+def fragment(func):
+    """Run func as a Streamlit fragment, so its own widgets rerun only func.
+
+    st.fragment is looked up on every call rather than at import, so the headless
+    recorder's stand-in applies, and a rerun of just the fragment is still logged
+    under the section that first drew it.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        section = instrumentation.current_section.get()
+
+        @wraps(func)
+        def rerunnable():
+            token = instrumentation.current_section.set(section)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                instrumentation.current_section.reset(token)
+
+        return st.fragment(rerunnable)()
+    return wrapper
+
 def create_equation(latex_string):
     """Display LaTeX equation with proper formatting."""
     st.markdown(f"$${latex_string}$$")
@@ -66,42 +88,49 @@ def create_comparison_table(data_dict):
     st.markdown(table_html, unsafe_allow_html=True)
 
 def create_timeline(events_dict):
-    """Create a visual timeline of events."""
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    years = list(events_dict.keys())
-    descriptions = list(events_dict.values())
-    
-    # Convert years to numeric values for plotting
-    if isinstance(years[0], str):
-        # If years are strings (e.g., "1905"), convert to integers
-        numeric_years = [int(y) if y.isdigit() else i for i, y in enumerate(years)]
-    else:
-        numeric_years = years
-    
-    # Plot events as points
-    ax.scatter(numeric_years, [1] * len(numeric_years), s=100, color='blue')
-    
-    # Add event descriptions
-    for i, (year, desc) in enumerate(zip(numeric_years, descriptions)):
-        ax.annotate(f"{year}: {desc}", 
-                  xy=(year, 1), 
-                  xytext=(0, (-1)**i * 20),  # Alternate up and down
-                  textcoords="offset points",
-                  ha='center', 
-                  va='center',
-                  bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8),
-                  arrowprops=dict(arrowstyle="->"))
-    
-    # Set limits and remove y-axis
-    ax.set_ylim(0, 2)
-    ax.set_yticks([])
-    
-    # Format x-axis if using actual years
-    if isinstance(years[0], str) and years[0].isdigit():
-        ax.set_xticks(numeric_years)
-        ax.set_xticklabels(years)
-    
-    ax.set_title("Timeline of Developments")
-    
-    return fig
+    """Create a visual timeline of events; returns PNG bytes, not a Matplotlib Figure.
+    
+    Show the result with figure_cache.show_figure or st.image. The figure itself goes
+    back to the figures pool once it has been rasterized, so it cannot be returned.
+    """
+    # Imported here so slides without charts don't load matplotlib
+    import figures
+    from figure_cache import figure_png
+    
+    with figures.subplots(figsize=(12, 6)) as (fig, ax):
+        years = list(events_dict.keys())
+        descriptions = list(events_dict.values())
+    
+        # Convert years to numeric values for plotting
+        if isinstance(years[0], str):
+            # If years are strings (e.g., "1905"), convert to integers
+            numeric_years = [int(y) if y.isdigit() else i for i, y in enumerate(years)]
+        else:
+            numeric_years = years
+    
+        # Plot events as points
+        ax.scatter(numeric_years, [1] * len(numeric_years), s=100, color='blue')
+    
+        # Add event descriptions
+        for i, (year, desc) in enumerate(zip(numeric_years, descriptions)):
+            ax.annotate(f"{year}: {desc}", 
+                      xy=(year, 1), 
+                      xytext=(0, (-1)**i * 20),  # Alternate up and down
+                      textcoords="offset points",
+                      ha='center', 
+                      va='center',
+                      bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8),
+                      arrowprops=dict(arrowstyle="->"))
+    
+        # Set limits and remove y-axis
+        ax.set_ylim(0, 2)
+        ax.set_yticks([])
+    
+        # Format x-axis if using actual years
+        if isinstance(years[0], str) and years[0].isdigit():
+            ax.set_xticks(numeric_years)
+            ax.set_xticklabels(years)
+    
+        ax.set_title("Timeline of Developments")
+    
+        return figure_png(fig)